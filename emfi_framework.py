@@ -20,7 +20,10 @@ __author__ = "Anton Kettling"
 __version__ = "1.0.0"
 __maintainer__ = "Anton Kettling"
 
+import asyncio
+import collections
 import concurrent.futures
+import functools
 from pylablib.devices import Thorlabs
 from chipshouter import ChipSHOUTER
 from chipshouter.com_tools import Reset_Exception, Max_Retry_Exception
@@ -31,21 +34,21 @@ import queue
 import serial
 import math
 import binascii
-import traceback
 import pickle
 import os
+import shutil
 import glob
+import json
 import csv
-import matplotlib
-matplotlib.use('Agg')  # Use the non-GUI backend
-import matplotlib.pyplot as plt
 import numpy as np
 import os
 from Crypto.Signature import PKCS1_v1_5 as signalgo
 from Crypto.PublicKey import RSA #2048
-from Crypto.Hash import SHA256
+import hashlib
 import random
+import re
 from enum import Enum, auto
+from dataclasses import dataclass, field
 
 from textual import on, work
 from textual.app import App, ComposeResult
@@ -53,8 +56,20 @@ from textual.containers import Container, Grid
 from textual.widgets import Header, Footer, Log, ProgressBar, Input, Static, Label, Button
 from textual.screen import Screen, ModalScreen
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import argparse
 
+class LazyPyplot:
+    # matplotlib is only needed for exporting results, so defer its slow import until first use
+    def __getattr__(self, name):
+        import matplotlib
+        matplotlib.use('Agg')  # Use the non-GUI backend
+        import matplotlib.pyplot
+        globals()["plt"] = matplotlib.pyplot
+        return getattr(matplotlib.pyplot, name)
+
+plt = LazyPyplot()
+
 
 """
 Motor parameters:
@@ -80,6 +95,8 @@ limit_switch="reverse"
 velocity=1.0
 max_travel=50.0
 
+MAX_RETRIES = 3 # How often a failed motor command is retried (re-initializing the axes in between) before the scan is aborted
+
 """
 ### Experiment parameters
 """
@@ -176,18 +193,197 @@ TARGET_PORT         = None # Something like "/dev/ttyUSB0", set automatically
 ARDUINO_PORT        = None # Something like "/dev/ttyUSB0", set automatically
 
 target_lock = threading.RLock()
-dummy_lock = threading.Lock()
 event_queue = queue.Queue()
 stop_event = threading.Event()
 
 DELAY_INCREMENT_in_ms = None
 NO_OF_TRIES_PER_DELAY_INCREMENT = None
 
-POS_COUNTER = 0
-SIG_COUNTER = 0
-CS_DISABLED_FOR_COUNTER = 0
 
-DIRECTION = STARTING_DIRECTION
+@dataclass
+class ScanState:
+    # Progress along the scan pattern. jog() runs on the worker thread while the UI reads it, so changes are made while holding lock
+    direction: str = STARTING_DIRECTION
+    pos_counter: int = 0
+    path: np.ndarray = None # (N,2) array of X/Y positions relative to REFERENCE_POINT, built once the starting position is reached
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+SCAN = ScanState()
+
+@dataclass(slots=True)
+class SignatureCounters:
+    # Counters that change on every received signature, kept as slots on one object instead of separate module globals
+    total: int = 0 # all received signatures, also those skipped while the ChipSHOUTER is disabled
+    cs_disabled_for: int = 0 # signatures received in a row while the ChipSHOUTER was disabled
+
+COUNTERS = SignatureCounters()
+
+class SigParams:
+    # Parameters at the time a signature or alarm was received. Instances are pooled and handed back by the worker loop once the handler is done,
+    # so anything that keeps them beyond that has to store as_dict() instead
+    __slots__ = ("position", "time", "voltage_set", "voltage_measured", "pattern")
+    _pool = collections.deque()
+
+    @classmethod
+    def acquire(cls):
+        try:
+            return cls._pool.pop()
+        except IndexError:
+            return cls()
+
+    def release(self):
+        self._pool.append(self)
+
+    def as_dict(self):
+        return {
+            "position": self.position._asdict(),
+            "time": self.time,
+            "voltage_set": self.voltage_set,
+            "voltage_measured": self.voltage_measured,
+            "pattern": self.pattern,
+        }
+
+SigParams._pool.extend(SigParams() for _ in range(64))
+
+class SignatureParams:
+    # Every tried set of parameters and its result until the next export. Numeric values are kept column-wise in a preallocated
+    # numpy array (NaN or _INT_UNSET where unknown), so recording a try writes a few slots instead of building a dict per signature.
+    # The worker and the listener thread both record tries, so every access takes the lock
+    COLUMNS = ("x", "y", "z", "voltage_set", "voltage_measured", "between_trigger_and_signGen_ms", "trigger_duration_ns")
+    INT_COLUMNS = ("between_trigger_and_signGen_ms", "trigger_duration_ns")
+    DTYPE = np.dtype([(column, "f8") for column in COLUMNS[:-len(INT_COLUMNS)]] + [(column, "i8") for column in INT_COLUMNS]) # INT_COLUMNS come last
+    _INT_UNSET = np.iinfo(np.int64).min
+    # The ChipSHOUTER reports voltages as ints, they are written without ".0" unless a fractional one was set
+    INTEGRAL_COLUMNS = ("voltage_set", "voltage_measured")
+
+    def __init__(self, capacity=4096):
+        self._lock = threading.Lock()
+        self.values = self._blank(capacity)
+        self.results = []
+        self.times = []
+        self.patterns = []
+
+    def _blank(self, capacity):
+        values = np.empty(capacity, dtype=self.DTYPE)
+        for column in self.COLUMNS:
+            values[column] = self._INT_UNSET if column in self.INT_COLUMNS else np.nan
+        return values
+
+    def __len__(self):
+        return len(self.results)
+
+    def append(self, result, sig_params):
+        with self._lock:
+            i = len(self.results)
+            if i == len(self.values):
+                grown = self._blank(max(2 * len(self.values), 1))
+                grown[:i] = self.values
+                self.values = grown
+
+            self.results.append(result)
+            if sig_params is None:
+                self.times.append(None)
+                self.patterns.append(None)
+                return
+
+            x, y, z = sig_params.position
+            for column, value in (("x", x), ("y", y), ("z", z), ("voltage_set", sig_params.voltage_set), ("voltage_measured", sig_params.voltage_measured)):
+                if value is not None:
+                    self.values[column][i] = value
+            self.times.append(sig_params.time)
+            self.patterns.append(sig_params.pattern)
+
+    def set_last(self, key, value):
+        with self._lock:
+            if not self.results:
+                return False
+            if key == "result":
+                self.results[-1] = value
+            else:
+                self.values[key][len(self.results) - 1] = value
+            return True
+
+    def rows(self):
+        # One tuple (time, result, *COLUMNS, pattern) per try for exporting, empty strings where a value is unknown
+        with self._lock:
+            n = len(self.results)
+            columns = []
+            for column in self.COLUMNS:
+                values = self.values[column][:n].tolist()
+                if column in self.INT_COLUMNS:
+                    columns.append(["" if value == self._INT_UNSET else value for value in values])
+                elif column in self.INTEGRAL_COLUMNS:
+                    columns.append(["" if value != value else int(value) if value.is_integer() else value for value in values])
+                else:
+                    columns.append(["" if value != value else value for value in values])
+            return list(zip(self.times, self.results, *columns, self.patterns))
+
+    def take(self):
+        # Hands the recorded tries over in a new SignatureParams and continues with empty buffers of the same capacity
+        taken = SignatureParams(0)
+        with self._lock:
+            taken.values, taken.results, taken.times, taken.patterns = self.values, self.results, self.times, self.patterns
+            self.values = self._blank(len(taken.values))
+            self.results = []
+            self.times = []
+            self.patterns = []
+        return taken
+
+    def clear(self):
+        with self._lock:
+            n = len(self.results)
+            for column in self.COLUMNS:
+                self.values[column][:n] = self._INT_UNSET if column in self.INT_COLUMNS else np.nan
+            self.results.clear()
+            self.times.clear()
+            self.patterns.clear()
+
+class PastTimings:
+    # Timings of the last ROLLING_N shots in fixed-size numpy ring buffers, so memory stays bounded during long runs
+    # and the statistics at shutdown run on contiguous arrays instead of walking Python lists
+    def __init__(self, capacity=100_000):
+        self.between_trigger_and_signGen_ms = np.empty(capacity, dtype=np.int64)
+        self.trigger_duration_ns = np.empty(capacity, dtype=np.int64)
+        self.count = 0 # total number of recorded shots, may exceed the capacity
+
+    def __len__(self):
+        return min(self.count, len(self.trigger_duration_ns))
+
+    def append(self, between_trigger_and_signGen_ms, trigger_duration_ns):
+        i = self.count % len(self.trigger_duration_ns)
+        self.between_trigger_and_signGen_ms[i] = between_trigger_and_signGen_ms
+        self.trigger_duration_ns[i] = trigger_duration_ns
+        self.count += 1
+
+    def window(self, column):
+        return getattr(self, column)[:len(self)]
+
+    @classmethod
+    def from_checkpoint(cls, stored):
+        # Older checkpoints stored two plain lists
+        if isinstance(stored, cls):
+            return stored
+        timings = cls()
+        for between, duration in zip(stored["between_trigger_and_signGen_ms"], stored["trigger_duration_ns"]):
+            timings.append(between, duration)
+        return timings
+
+    def __getstate__(self):
+        # Checkpoints only carry the filled part of the buffers instead of the whole capacity
+        return {
+            "capacity": len(self.trigger_duration_ns),
+            "count": self.count,
+            "between_trigger_and_signGen_ms": self.window("between_trigger_and_signGen_ms").copy(),
+            "trigger_duration_ns": self.window("trigger_duration_ns").copy(),
+        }
+
+    def __setstate__(self, state):
+        self.__init__(state["capacity"])
+        self.count = state["count"]
+        n = len(state["trigger_duration_ns"])
+        self.between_trigger_and_signGen_ms[:n] = state["between_trigger_and_signGen_ms"]
+        self.trigger_duration_ns[:n] = state["trigger_duration_ns"]
+
 STARTING_POSITION = None
 ALLOW_MOVEMENT = True
 FAULT_PATTERN = FAULT_PATTERN_START
@@ -197,6 +393,12 @@ DEAD_TIME = DEAD_TIME_START
 VARIABLE_STATE = 0
 FAULT_VOLTAGE_INCREMENTS = 10
 FAULT_PATTERN_INCREMENTS = MIN_HIGH_TIME_ns
+HIGH_TIME_START = FAULT_PATTERN_START.count(1) * FAULT_PATTERN_INCREMENTS
+# high times for the two variable steps at a position, only depend on constants
+if HIGH_TIME_START >= MAX_HIGH_TIME_ns:
+    _HIGH_TIME_STEPS = (HIGH_TIME_START - FAULT_PATTERN_INCREMENTS, HIGH_TIME_START - (2 * FAULT_PATTERN_INCREMENTS))
+else:
+    _HIGH_TIME_STEPS = (min(HIGH_TIME_START + FAULT_PATTERN_INCREMENTS, MAX_HIGH_TIME_ns), max(HIGH_TIME_START - FAULT_PATTERN_INCREMENTS, MIN_HIGH_TIME_ns))
 
 # size of the die that shall be probed
 BOUNDARIES = {
@@ -224,12 +426,15 @@ CURRENT_POSITION = {
     "Y": None,
     "Z": None
 }
+# Snapshot of CURRENT_POSITION that is republished after every update, so readers on other threads can keep a reference
+Position = collections.namedtuple("Position", "X Y Z")
+CURRENT_POSITION_TUPLE = Position(None, None, None)
 
 TRIES_LEFT_PER_POSITION = TRIES_PER_POSITION
 TRIES_LEFT_PER_POSITION_AND_TIME = None
 CONFIRMED_FAULTS = []
 CONFIRMED_ALARMS = []
-SIGNATURES_PARAMS = []
+SIGNATURES_PARAMS = SignatureParams()
 
 LOOPING_COUNTER_UNPARSEABLE_SIGNATURE = 60
 SHOW_UART = True if args.quickdebug else False
@@ -240,25 +445,83 @@ TARGET = None
 DUMMY_TARGET = None
 
 CURRENT_TIMING = {"after_trigger_ms": None, "trigger_duration_ns": None, "after_sign_ms": None}
-PAST_TIMINGS = {"between_trigger_and_signGen_ms": [], "trigger_duration_ns": []}
+PAST_TIMINGS = PastTimings()
 
 CURRENT_PROGRESS = 0
 TOTAL_PROGRESS = 1
 STEPS_REQUIRED = 0
 
+def progress_nbytes(total):
+    # Width of the progress counter in the unparseable signatures file. Kept in PROGRESS_NBYTES, update it whenever TOTAL_PROGRESS is set
+    return (int(total).bit_length() + 7) // 8
+
+PROGRESS_NBYTES = progress_nbytes(TOTAL_PROGRESS)
+
+_EXPECTED_SIG = bytes.fromhex(VALID_SIGNATURE) if VALID_SIGNATURE else b""
+_LEN_VALID_SIGNATURE = len(VALID_SIGNATURE) if VALID_SIGNATURE else 0
+_LEN_PREFIX = len(PREFIX)
+_UNPARSEABLE_SEPARATOR = b'\xff\x00' * 2 # frames the progress counter in the unparseable signatures file
+_REAL_MSG_HEX = REAL_MSG.hex() if isinstance(REAL_MSG, bytes) else None
+
+# Every length of a hex string the target may print besides signatures, including the tolerance of SerialTarget._is_parseable_string()
+_HEX_LENGTHS = [len(value) for value in (REAL_MSG, REAL_DIGEST) if value is not None]
+if isinstance(REAL_SIGN_PARAMS, dict):
+    _HEX_LENGTHS += [len(REAL_SIGN_PARAMS["PrivKey"]["n"]), len(REAL_SIGN_PARAMS["PrivKey"]["d"]), len(REAL_SIGN_PARAMS["PubKey"]["n"]), len(REAL_SIGN_PARAMS["PubKey"]["e"])]
+_HEX_STRING_LENGTHS = frozenset(
+    n for length in _HEX_LENGTHS
+    for n in range(length - int(max(1, length * 0.1)), length + int(max(1, length * 0.1)) + 1)
+)
+_EXPECTED_SCALE = (EncCntPerMm, SF_velocity, SF_acceleration)
+# Matches any of the defined alarm names in a single pass. Never matches if no alarms are defined
+_ALARM_RE = re.compile("|".join(re.escape(alarm) for alarm in ALARMS_DEFINED) if ALARMS_DEFINED else r"(?!)")
+# Timings are sent as "after_trigger_ms,trigger_duration_ns,after_sign_ms"
+_TIMING_RE = re.compile(r"\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*")
+_TIMING_MAX = int(np.iinfo(np.int64).max) # SIGNATURES_PARAMS and PAST_TIMINGS keep int64, longer digit runs come from corrupted lines
+# Classifies a line that arrived without a keyword in one match, trying timings, alarms (anywhere in the line) and pauses in this order
+_LINE_RE = re.compile(rf"(?P<timings>(?:{_TIMING_RE.pattern})\Z)|(?P<alarm>.*?(?:{_ALARM_RE.pattern}))|(?P<pause>for 30sec\Z)", re.DOTALL)
+# Keyword and description of each _LINE_RE group
+_LINE_CLASSES = {
+    "timings": ("Timings:", "the payload must be timings"),
+    "alarm": ("Alarm:", "the payload must be an alarm"),
+    "pause": ("Pause:", "target initiated a pause"),
+}
+
+def _last_frame(exc):
+    # File, line and function where exc was raised. Walks the traceback instead of building a FrameSummary for every frame
+    tb = exc.__traceback__
+    if tb is None:
+        return None
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    code = tb.tb_frame.f_code
+    return code.co_filename, tb.tb_lineno, code.co_name
+
+def backoff(attempt, base=0.5, cap=30.0):
+    # Capped exponential delay with jitter, so transient glitches recover quickly and persistent ones are not retried in lockstep
+    return min(cap, base * 2 ** attempt) * (0.5 + random.random())
+
+_TIME_CACHE = {} # Format -> (second, formatted time), as the formatted strings only change once per second
+
 def getTime(date=False, filehandle=False):
     if date and filehandle:
-        return time.strftime("%Y-%m-%d_%H-%M-%S" , time.localtime(time.time()))
+        fmt = "%Y-%m-%d_%H-%M-%S"
     elif date:
-        return time.strftime("%H:%M:%S (%d.%m.%Y)" , time.localtime(time.time()))
+        fmt = "%H:%M:%S (%d.%m.%Y)"
     else:
-        return time.strftime("%H:%M:%S" , time.localtime(time.time()))
+        fmt = "%H:%M:%S"
+
+    now = int(time.time())
+    cached = _TIME_CACHE.get(fmt)
+    if cached is None or cached[0] != now:
+        cached = (now, time.strftime(fmt, time.localtime(now)))
+        _TIME_CACHE[fmt] = cached
+    return cached[1]
     
 # Logging setup
 BASENAME_FILES = getTime(date=True, filehandle=True)
 LOGFILE = BASENAME_FILES + ".log"
 CHECKPOINT_FILE = None
-BOUNDARIES_FILE = "boundariesv3.pkl"
+BOUNDARIES_FILE = "boundariesv4.json"
 TARGET_NAME = ""
 class NoConsoleOnlyFilter(logging.Filter):
     def filter(self, record):
@@ -267,48 +530,63 @@ class NoConsoleOnlyFilter(logging.Filter):
 logger = logging.getLogger("lab")
 logger.setLevel(logging.DEBUG) if DEBUG else logger.setLevel(logging.INFO)
 
-file_handler = logging.FileHandler(LOGFILE, mode="a")
-file_handler.setLevel(logging.DEBUG) if DEBUG else file_handler.setLevel(logging.INFO)
-file_handler.addFilter(NoConsoleOnlyFilter())
-formatter = logging.Formatter("[%(asctime)s] | %(levelname)-7s | %(message)s", datefmt="%m/%d/%y %H:%M:%S")
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
+def create_file_handler(logfile):
+    handler = logging.FileHandler(logfile, mode="a")
+    handler.setLevel(logging.DEBUG) if DEBUG else handler.setLevel(logging.INFO)
+    handler.addFilter(NoConsoleOnlyFilter())
+    formatter = logging.Formatter("[%(asctime)s] | %(levelname)-7s | %(message)s", datefmt="%m/%d/%y %H:%M:%S")
+    handler.setFormatter(formatter)
+    return handler
+
+# The logfile is written by a separate thread, so logging does not block on disk I/O
+file_handler = create_file_handler(LOGFILE)
+log_queue = queue.Queue(-1)
+logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+log_listener.start()
 
 def update_logfile(new_basename):
-    global logger, LOGFILE, BASENAME_FILES
+    global logger, LOGFILE, BASENAME_FILES, file_handler, log_listener
 
     old_logfile = LOGFILE
     new_logfile = new_basename + ".log"
 
-    # Remove and close old file handler(s)
-    for handler in logger.handlers[:]:
-        if isinstance(handler, logging.FileHandler):
-            handler.close()
-            logger.removeHandler(handler)
+    # Flush pending records and close the old file handler
+    log_listener.stop()
+    file_handler.close()
 
     # Rename the file on disk
     try:
         os.rename(old_logfile, new_logfile)
-    except OSError as e:
-        logger.error(f"Failed to rename logfile from {old_logfile} to {new_logfile}. Continuing with old logfile.")
-        return
+    except OSError:
+        rename_failed = True
+    else:
+        rename_failed = False
 
-    # Update basename and logfile
-    BASENAME_FILES = new_basename
-    LOGFILE = BASENAME_FILES + ".log"
+        # Update basename and logfile
+        BASENAME_FILES = new_basename
+        LOGFILE = BASENAME_FILES + ".log"
 
     # Add new file handler
-    file_handler = logging.FileHandler(LOGFILE, mode="a")
-    file_handler.setLevel(logging.DEBUG) if DEBUG else file_handler.setLevel(logging.INFO)
-    file_handler.addFilter(NoConsoleOnlyFilter())
-    formatter = logging.Formatter("[%(asctime)s] | %(levelname)-7s | %(message)s", datefmt="%m/%d/%y %H:%M:%S")
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-    logger.info(f"Logfile updated to {LOGFILE}")       
+    file_handler = create_file_handler(LOGFILE)
+    log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    log_listener.start()
+
+    if rename_failed:
+        logger.error(f"Failed to rename logfile from {old_logfile} to {new_logfile}. Continuing with old logfile.")
+    else:
+        logger.info(f"Logfile updated to {LOGFILE}")
 
 """
 ### Dummy structures for testing
 """
+# Scales the simulated hardware delays. Not zero in quickdebug, so the dummy target does not flood the event queue
+DUMMY_TIME_SCALE = 0.01 if args.quickdebug else 1.0
+
+def dummy_sleep(seconds):
+    if seconds * DUMMY_TIME_SCALE > 0:
+        time.sleep(seconds * DUMMY_TIME_SCALE)
+
 class DummyAxis:
     def __init__(self, name):
         self.name = name
@@ -322,28 +600,28 @@ class DummyAxis:
     def is_moving(self):
         return False
     
-    def wait_for_stop():
+    def wait_for_stop(self):
         return
     
     def stop(self, immediate=True, sync=True):
-        logger.debug(f"Dummy {self.name}-Axis received an emergency stop")
+        logger.debug("Dummy %s-Axis received an emergency stop", self.name)
 
     def move_to(self, position):
         self.position = position
-        time.sleep(0.3)
-        logger.debug(f"Dummy {self.name}-Axis moved to {position:.3f}mm")
+        dummy_sleep(0.3)
+        logger.debug("Dummy %s-Axis moved to %.3fmm", self.name, position)
 
     def jog(self, direction):
         if direction == "+" :
             self.position += self.step_size
-            time.sleep(0.3)
+            dummy_sleep(0.3)
         elif direction == "-":
             self.position -= self.step_size
-            time.sleep(0.3)
+            dummy_sleep(0.3)
     
     def setup_jog(self, mode=None, step_size=None, min_velocity=None, acceleration=None, max_velocity=None, stop_mode=None, channel=None, scale=True):
         self.step_size = step_size
-        logger.debug(f"Dummy {self.name}-Axis set jog-speed to {self.step_size:.3f}mm")
+        logger.debug("Dummy %s-Axis set jog-speed to %.3fmm", self.name, self.step_size)
         return
 
     def get_position(self):
@@ -352,10 +630,12 @@ class DummyAxis:
     def is_homed(self):
         return self.homed
     
-    def home(self):
-        time.sleep(1)
+    def home(self, sync=True):
+        if not sync:
+            return
+        dummy_sleep(1)
         self.homed = True
-        logger.debug(f"Dummy {self.name}-Axis homed at position {self.position:.3f}mm")
+        logger.debug("Dummy %s-Axis homed at position %.3fmm", self.name, self.position)
         return
     
     def wait_for_home(self):
@@ -365,20 +645,22 @@ class DummyAxis:
         return 0, acceleration, max_velocity
     
     def get_scale(self):
-        return EncCntPerMm, SF_velocity, SF_acceleration
+        return _EXPECTED_SCALE
     
     def get_scale_units(self):
         return "user"
 
     def blink(self):
-        logger.debug(f"Dummy {self.name}-Axis blinked")
+        logger.debug("Dummy %s-Axis blinked", self.name)
 
     def close(self):
-        logger.debug(f"Dummy {self.name}-Axis closed")
+        logger.debug("Dummy %s-Axis closed", self.name)
         return True
 
 class DummyChipSHOUTER:
 
+    _PAT_WAVE_TABLE = bytes.maketrans(b'\x00\x01', b'01')
+
     class DummyVoltage:
         def __init__(self, value):
             self.set = value
@@ -415,14 +697,18 @@ class DummyChipSHOUTER:
 
     @property
     def pat_wave(self):
-        # Return as string of 0s and 1s
-        return ''.join(str(x) for x in self._pat_wave)
+        # Return as string of 0s and 1s, serialized once per pattern change
+        if self._pat_wave_str is None:
+            self._pat_wave_str = self._pat_wave.tobytes().translate(self._PAT_WAVE_TABLE).decode()
+        return self._pat_wave_str
 
     @pat_wave.setter
     def pat_wave(self, value):
         # Accept list/array of ints
-        if isinstance(value, (list, tuple)) and all(x in (0, 1) for x in value):
-            self._pat_wave = list(value)
+        pattern = np.asarray(value) if isinstance(value, (list, tuple, np.ndarray)) else None
+        if pattern is not None and pattern.ndim == 1 and pattern.dtype.kind in "biuf" and ((pattern == 0) | (pattern == 1)).all():
+            self._pat_wave = pattern.astype(np.uint8)
+            self._pat_wave_str = None
         else:
             logger.error("pat_wave must be a list or tuple of 0s and 1s")
             stop_event.set()
@@ -436,258 +722,240 @@ class DummyChipSHOUTER:
     def disconnect(self):
         pass
 
+# Banner that DummyTarget prints after a reset, loaded once and already encoded
+_HEADER_LINES_BYTES = ()
+if HEADER_FILE_PATH is not None:
+    try:
+        with open(HEADER_FILE_PATH, "rb") as f:
+            _HEADER_LINES_BYTES = tuple(f.readlines())
+    except OSError:
+        pass # Reported by verifyParameters()
+
+_VALID_PAYLOAD = PREFIX + _EXPECTED_SIG
+_FAULT_PAYLOAD = PREFIX + bytes.fromhex("2df71ed42d6bf9174c938555aae4f3ddf50c1bdcb3ee226adeb647612c45f5c32ea27075937e5ee98d9879e4acbd4dd63a7b40b5b35f3f6f8a76f17845a96f210e28ab25979176ed09ea287c229dfcebc2cd7d511d8e8a3c55bcbee7a16093343f1b670bc180ead2f26af5d391ef29e15cf0707f588abc9c3e11365ca96ce529")
+
 class DummyTarget:
 
-    def __init__(self, reset_enabled=True, faults_enabled=False, deterministic_errors=True, error_probability=0.05, start_on_error=0, delay=(EXPECTED_DURATION_SIG_GEN_ms / 1000), keyword="Signature:", payload=(PREFIX + binascii.unhexlify(VALID_SIGNATURE))):
+    # Fault states (keyword, message) that are simulated in order if deterministic_errors is set
+    _ERROR_TABLE = (
+        ("unparseable", ""),
+        ("empty", ""),
+        ("long", ""),
+        ("no", ""),
+        ("unparseable", "unparseable"),
+        ("unparseable", "long"),
+        ("unparseable", "empty"),
+        ("unparseable", "no"),
+        ("empty", ""),
+        ("empty", "unparseable"),
+        ("empty", "long"),
+        ("empty", "empty"),
+        ("empty", "no"),
+        ("no", ""),
+        ("no", "unparseable"),
+        ("no", "long"),
+        ("no", "empty"),
+        ("no", "no"),
+        ("long", "unparseable"),
+        ("long", "long"),
+        ("long", "empty"),
+        ("long", "no"),
+        ("", "unparseable"),
+        ("", "empty"),
+        ("", "long"),
+        ("", "no"),
+    )
+    _KEYWORD_KEYS = ("unparseable", "long", "empty", "no")
+    _MESSAGE_KEYS = ("unparseable", "long", "empty", "no")
+
+    # Bits of fault_state
+    KW_UNPARSEABLE, KW_LONG, KW_EMPTY, KW_NO = 1, 2, 4, 8
+    MSG_UNPARSEABLE, MSG_LONG, MSG_EMPTY, MSG_NO = 16, 32, 64, 128
+    POWER_LOSS = KW_NO | MSG_NO
+    _KEYWORD_BITS = {"": 0, "unparseable": KW_UNPARSEABLE, "long": KW_LONG, "empty": KW_EMPTY, "no": KW_NO}
+    _MESSAGE_BITS = {"": 0, "unparseable": MSG_UNPARSEABLE, "long": MSG_LONG, "empty": MSG_EMPTY, "no": MSG_NO}
+
+    def __init__(self, reset_enabled=True, faults_enabled=False, deterministic_errors=True, error_probability=0.05, start_on_error=0, delay=(EXPECTED_DURATION_SIG_GEN_ms / 1000), keyword="Signature:", payload=_VALID_PAYLOAD):
         self.reset_enabled = reset_enabled
         self.faults_enabled = faults_enabled
         self.deterministic_errors = deterministic_errors
         self.error_probability = error_probability
         self.delay = delay
         self.keyword = keyword
+        self.keyword_bytes = keyword.encode()
+        self.keyword_unparseable = self.keyword_bytes[:(len(keyword)//2)] + b'\xff' * (len(keyword)//2)
+        self.keyword_long = (keyword + 2000 * keyword[-1]).encode()
         self.real_payload = payload
 
         # internal states
         self.payload = payload
         self.next_error = start_on_error
         self.messages_since_last_fault = 0
-        self.fault_state = {
-            "keyword": {
-                "unparseable": False,
-                "long": False,
-                "empty": False,
-                "no": False,
-            },
-            "message": {
-                "unparseable": False,
-                "long": False,
-                "empty": False,
-                "no": False,
-            },
-            "power": {
-                "loss": False,
-            }
-        }
+        self.fault_state = 0
         self.reset_required = False
-        self.reset_buffer = []
+        self.reset_buffer = collections.deque()
+        self.reset_requests = queue.SimpleQueue()
+        self.message_lines = {}
+        self.rng = np.random.default_rng()
+        self.random_buffer = self.rng.random(4096)
+        self.random_index = 0
         self.keyword_sent = False
-        with open(HEADER_FILE_PATH, "r") as f:
-            self.header_lines = [line for line in f.readlines()]
+        self.header_lines = _HEADER_LINES_BYTES
     
     def close(self):
         pass
 
     def reset(self):
-        with dummy_lock:
-            self.reset_required = False
-            self.messages_since_last_fault = 0
-            self.fault_state = {
-                "keyword": {
-                    "unparseable": False,
-                    "long": False,
-                    "empty": False,
-                    "no": False,
-                },
-                "message": {
-                    "unparseable": False,
-                    "long": False,
-                    "empty": False,
-                    "no": False,
-                }
-            }
-            for line in self.header_lines:
-                self.reset_buffer.append(line)
-        time.sleep(3)
+        # Only request the reset here. It is applied by the reading thread, so read_until() does not need a lock
+        self.reset_requests.put(True)
+        dummy_sleep(3)
         return
 
-    def read_until(self, delimiter, size=None):
-        with dummy_lock:
-
-            self.payload += delimiter
-            self.real_payload += delimiter
-
-            # After reset, we simulate reporting the startup banner
-            if self.reset_buffer:
-                return self.reset_buffer.pop(0).encode()
-            
-            # Set any of the pre-configured error-states
-            if self.reset_enabled and not self.reset_required and (self.deterministic_errors or random.random() <= self.error_probability or FAULT_VOLTAGE >= 300):
-                if self.messages_since_last_fault > 20:
-                    self.reset_required = True
-                    fault_type_keyword = ""
-                    fault_type_message = ""
-
-                    if self.deterministic_errors:
-                    
-                        if self.next_error == 0:
-                            fault_type_keyword = "unparseable"
-                        elif self.next_error == 1:
-                            fault_type_keyword = "empty"
-                        elif self.next_error == 2:
-                            fault_type_keyword = "long"
-                        elif self.next_error == 3:
-                            fault_type_keyword = "no"
-                        elif self.next_error == 4:
-                            fault_type_keyword = "unparseable"
-                            fault_type_message = "unparseable"
-                        elif self.next_error == 5:
-                            fault_type_keyword = "unparseable"
-                            fault_type_message = "long"
-                        elif self.next_error == 6:
-                            fault_type_keyword = "unparseable"
-                            fault_type_message = "empty"
-                        elif self.next_error == 7:
-                            fault_type_keyword = "unparseable"
-                            fault_type_message = "no"
-                        elif self.next_error == 8:
-                            fault_type_keyword = "empty"
-                        elif self.next_error == 9:
-                            fault_type_keyword = "empty"
-                            fault_type_message = "unparseable"
-                        elif self.next_error == 10:
-                            fault_type_keyword = "empty"
-                            fault_type_message = "long"
-                        elif self.next_error == 11:
-                            fault_type_keyword = "empty"
-                            fault_type_message = "empty"
-                        elif self.next_error == 12:
-                            fault_type_keyword = "empty"
-                            fault_type_message = "no"
-                        elif self.next_error == 13:
-                            fault_type_keyword = "no"
-                        elif self.next_error == 14:
-                            fault_type_keyword = "no"
-                            fault_type_message = "unparseable"
-                        elif self.next_error == 15:
-                            fault_type_keyword = "no"
-                            fault_type_message = "long"
-                        elif self.next_error == 16:
-                            fault_type_keyword = "no"
-                            fault_type_message = "empty"
-                        elif self.next_error == 17:
-                            fault_type_keyword = "no"
-                            fault_type_message = "no"
-                        elif self.next_error == 181:
-                            fault_type_keyword = "long"
-                            fault_type_message = "unparseable"
-                        elif self.next_error == 19:
-                            fault_type_keyword = "long"
-                            fault_type_message = "long"
-                        elif self.next_error == 20:
-                            fault_type_keyword = "long"
-                            fault_type_message = "empty"
-                        elif self.next_error == 21:
-                            fault_type_keyword = "long"
-                            fault_type_message = "no"
-                        elif self.next_error == 22:
-                            fault_type_message = "unparseable"
-                        elif self.next_error == 23:
-                            fault_type_message = "empty"
-                        elif self.next_error == 24:
-                            fault_type_message = "long"
-                        elif self.next_error == 25:
-                            fault_type_message = "no"
+    def _apply_reset(self):
+        self.reset_required = False
+        self.messages_since_last_fault = 0
+        self.fault_state = 0
+        self.reset_buffer.extend(self.header_lines)
+
+    def _rand(self):
+        # Uniform random number in [0, 1), drawn in batches from the generator
+        if self.random_index == len(self.random_buffer):
+            self.random_buffer = self.rng.random(4096)
+            self.random_index = 0
+        value = self.random_buffer[self.random_index]
+        self.random_index += 1
+        return value
+
+    def _message_lines(self, payload, delimiter):
+        # Regular, unparseable and long variant of a message. Built once per payload as they do not change
+        lines = self.message_lines.get((payload, delimiter))
+        if lines is None:
+            line = payload + delimiter
+            half = len(line) // 2
+            lines = (line, line[:half] + b'\xff' * half, line + line[-1:] * 2000)
+            self.message_lines[(payload, delimiter)] = lines
+        return lines
 
-                    else:
-                        fault_type_keyword = random.choice(list(self.fault_state["keyword"].keys()))
-                        fault_type_message = random.choice(list(self.fault_state["message"].keys()))
-
-                    self.fault_state["keyword"][fault_type_keyword] = True
-                    self.fault_state["message"][fault_type_message] = True
-
-                    if fault_type_keyword and fault_type_message:
-                        logger.info(f"Simulating fault state of target with {fault_type_keyword} keyword and {fault_type_message} message")
-                    elif fault_type_keyword:
-                        logger.info(f"Simulating fault state of target with {fault_type_keyword} keyword")
-                    elif fault_type_message:
-                        logger.info(f"Simulating fault state of target with {fault_type_message} message")
-                    else:
-                        logger.error("Simulating fault state of target with no keyword and no message, this should not happen!")
+    def read_until(self, delimiter, size=None):
+        # Apply resets that were requested by other threads
+        if not self.reset_requests.empty():
+            while not self.reset_requests.empty():
+                self.reset_requests.get_nowait()
+            self._apply_reset()
+
+        # After reset, we simulate reporting the startup banner
+        if self.reset_buffer:
+            return self.reset_buffer.popleft()
+        
+        # Set any of the pre-configured error-states
+        if self.reset_enabled and not self.reset_required and (self.deterministic_errors or self._rand() <= self.error_probability or FAULT_VOLTAGE >= 300):
+            if self.messages_since_last_fault > 20:
+                self.reset_required = True
 
-                    if self.next_error < 25:
-                        self.next_error += 1
-                    else:
-                        self.next_error = 0
-                        if self.deterministic_errors: logger.info("Simulated all possible fault states!")
+                if self.deterministic_errors:
+                    fault_type_keyword, fault_type_message = self._ERROR_TABLE[self.next_error] if self.next_error < len(self._ERROR_TABLE) else ("", "")
                 else:
-                    self.messages_since_last_fault += 1
-                    logger.debug(f"DummyTarget has sent {self.messages_since_last_fault} messages since last fault")
-
-            if self.fault_state["keyword"]["no"] and self.fault_state["message"]["no"]:
-                logger.debug("DummyTarget simulates power loss")
-                raise Exception("Simulating power loss as fault state of target")
-            
-            time.sleep(self.delay)
-            
-            # Send keyword first
-            if not self.keyword_sent:
+                    fault_type_keyword = self._KEYWORD_KEYS[int(self._rand() * len(self._KEYWORD_KEYS))]
+                    fault_type_message = self._MESSAGE_KEYS[int(self._rand() * len(self._MESSAGE_KEYS))]
 
-                self.keyword_sent = True
+                self.fault_state |= self._KEYWORD_BITS[fault_type_keyword] | self._MESSAGE_BITS[fault_type_message]
 
-                if not self.reset_required:
-                    logger.debug("DummyTarget sends keyword")
-                    return self.keyword.encode()
-                
-                elif self.fault_state["keyword"]["unparseable"]:
-                    logger.debug("DummyTarget sends unparseable keyword")
-                    return self.keyword.encode()[:(len(self.keyword)//2)] + b'\xff' * (len(self.keyword)//2)
-                
-                elif self.fault_state["keyword"]["long"]:
-                    logger.debug("DummyTarget sends long keyword")
-                    return (self.keyword + 2000 * self.keyword[-1]).encode()
-                
-                elif self.fault_state["keyword"]["empty"]:
-                    logger.debug("DummyTarget sends empty keyword")
-                    return "".encode()
-                
-                elif self.fault_state["keyword"]["no"]:
-                    logger.debug("DummyTarget sends no keyword")
-                    pass
-                
-            
-            # Simulate random faults in the upper right corner of the chip
-            if self.faults_enabled:
-                self.payload = PREFIX + binascii.unhexlify("2df71ed42d6bf9174c938555aae4f3ddf50c1bdcb3ee226adeb647612c45f5c32ea27075937e5ee98d9879e4acbd4dd63a7b40b5b35f3f6f8a76f17845a96f210e28ab25979176ed09ea287c229dfcebc2cd7d511d8e8a3c55bcbee7a16093343f1b670bc180ead2f26af5d391ef29e15cf0707f588abc9c3e11365ca96ce529") + delimiter
-                # raise NotImplementedError("DummyTarget does not support faults as the .get_position does not care for the REFERENCE_POINT")
-                # x_pos = AXES["X"].get_position()
-                # y_pos = AXES["Y"].get_position()
-                # x_left = BOUNDARIES["X"]["LEFT"]
-                # x_right = BOUNDARIES["X"]["RIGHT"]
-                # y_up = BOUNDARIES["Y"]["UP"]
-                # y_down = BOUNDARIES["Y"]["DOWN"]
-                # if (
-                #     x_left >= x_pos >= (x_left + x_right) / 2 and
-                #     y_up >= y_pos >= (y_up + y_down) / 2
-                # ):
-                #     self.payload = self.real_payload[:-1] + b'A'
+                if fault_type_keyword and fault_type_message:
+                    logger.info(f"Simulating fault state of target with {fault_type_keyword} keyword and {fault_type_message} message")
+                elif fault_type_keyword:
+                    logger.info(f"Simulating fault state of target with {fault_type_keyword} keyword")
+                elif fault_type_message:
+                    logger.info(f"Simulating fault state of target with {fault_type_message} message")
+                else:
+                    logger.error("Simulating fault state of target with no keyword and no message, this should not happen!")
 
+                if self.next_error < len(self._ERROR_TABLE) - 1:
+                    self.next_error += 1
+                else:
+                    self.next_error = 0
+                    if self.deterministic_errors: logger.info("Simulated all possible fault states!")
             else:
-                self.payload = self.real_payload
+                self.messages_since_last_fault += 1
+                logger.debug("DummyTarget has sent %s messages since last fault", self.messages_since_last_fault)
+
+        if (self.fault_state & self.POWER_LOSS) == self.POWER_LOSS:
+            logger.debug("DummyTarget simulates power loss")
+            raise Exception("Simulating power loss as fault state of target")
+        
+        dummy_sleep(self.delay)
+        
+        # Send keyword first
+        if not self.keyword_sent:
 
-            # Send actual message second
-            self.keyword_sent = False
+            self.keyword_sent = True
 
             if not self.reset_required:
-                logger.debug(f"DummyTarget sends message")
-                return self.payload
-                
-            elif self.fault_state["message"]["unparseable"]:
-                logger.debug(f"DummyTarget sends unparseable message")
-                return self.payload[:(len(self.payload)//2)] + b'\xff' * (len(self.payload)//2)
+                logger.debug("DummyTarget sends keyword")
+                return self.keyword_bytes
+            
+            elif self.fault_state & self.KW_UNPARSEABLE:
+                logger.debug("DummyTarget sends unparseable keyword")
+                return self.keyword_unparseable
             
-            elif self.fault_state["message"]["long"]:
-                    logger.debug("DummyTarget sends long message")
-                    return (self.payload + 2000 * self.payload[-1])
+            elif self.fault_state & self.KW_LONG:
+                logger.debug("DummyTarget sends long keyword")
+                return self.keyword_long
             
-            elif self.fault_state["message"]["empty"]:
-                logger.debug(f"DummyTarget sends empty message")
-                return ""
+            elif self.fault_state & self.KW_EMPTY:
+                logger.debug("DummyTarget sends empty keyword")
+                return b""
             
-            elif self.fault_state["message"]["no"]:
-                logger.debug(f"DummyTarget sends no message")
+            elif self.fault_state & self.KW_NO:
+                logger.debug("DummyTarget sends no keyword")
                 pass
+            
+        
+        # Simulate random faults in the upper right corner of the chip
+        if self.faults_enabled:
+            self.payload = _FAULT_PAYLOAD
+            # raise NotImplementedError("DummyTarget does not support faults as the .get_position does not care for the REFERENCE_POINT")
+            # x_pos = AXES["X"].get_position()
+            # y_pos = AXES["Y"].get_position()
+            # x_left = BOUNDARIES["X"]["LEFT"]
+            # x_right = BOUNDARIES["X"]["RIGHT"]
+            # y_up = BOUNDARIES["Y"]["UP"]
+            # y_down = BOUNDARIES["Y"]["DOWN"]
+            # if (
+            #     x_left >= x_pos >= (x_left + x_right) / 2 and
+            #     y_up >= y_pos >= (y_up + y_down) / 2
+            # ):
+            #     self.payload = self.real_payload[:-1] + b'A'
 
+        else:
+            self.payload = self.real_payload
+
+        # Send actual message second
+        self.keyword_sent = False
+        message, unparseable_message, long_message = self._message_lines(self.payload, delimiter)
+
+        if not self.reset_required:
+            logger.debug("DummyTarget sends message")
+            return message
+            
+        elif self.fault_state & self.MSG_UNPARSEABLE:
+            logger.debug("DummyTarget sends unparseable message")
+            return unparseable_message
+        
+        elif self.fault_state & self.MSG_LONG:
+                logger.debug("DummyTarget sends long message")
+                return long_message
+        
+        elif self.fault_state & self.MSG_EMPTY:
+            logger.debug("DummyTarget sends empty message")
             return b""
+        
+        elif self.fault_state & self.MSG_NO:
+            logger.debug("DummyTarget sends no message")
+            pass
+
+        return b""
+
+
 
 
 """ 
@@ -697,9 +965,17 @@ Motor-related functions
 class JogInteractively(Screen):
     """Screen for interactive jogging of axes and setting boundaries."""
 
+    # Dry-run jog buttons per axis as (label, id)
+    JOG_BUTTONS = {
+        "X": (("X-Left", "jog_positive"), ("X-Right", "jog_negative")),
+        "Y": (("Y-UP", "jog_positive"), ("Y-DOWN", "jog_negative")),
+        "Z": (("Z-UP", "jog_negative"), ("Z-DOWN", "jog_positive")),
+    }
+
     def __init__(self, axes, msg=""):
         super().__init__()
         self.axes = axes
+        self._axis_order = [axis for axis in ("X", "Y", "Z") if axis in self.axes]
         self.starting_speed = 3
         self.speed = 3
         self.levels = {1: 0.01, 2: 0.1, 3: 0.5, 4: 3.0}
@@ -710,28 +986,10 @@ class JogInteractively(Screen):
         yield Static(self.msg + " " + "+" * self.speed, id="jog_msg")
         if args.dryrun:
             yield Static("This is a dry-run. Jog the fake motors with the following knobs.", id="dryrun_msg")
-            if args.dryrun:
-                if "X" in self.axes:
-                    yield Static(f"Position X: {self.axes["X"].get_position():.3f}mm", id="pos-x")
-                if "Y" in self.axes:
-                    yield Static(f"Position Y: {self.axes["Y"].get_position():.3f}mm", id="pos-y")
-                if "Z" in self.axes:
-                    yield Static(f"Position Z: {self.axes["Z"].get_position():.3f}mm", id="pos-z")
-                if "X" in self.axes:
-                    yield Grid(
-                        Button("X-Left", id="jog_positive"),
-                        Button("X-Right", id="jog_negative")
-                    )
-                if "Y" in self.axes:
-                    yield Grid(
-                        Button("Y-UP", id="jog_positive"),
-                        Button("Y-DOWN", id="jog_negative")
-                    )
-                if "Z" in self.axes:
-                    yield Grid(
-                        Button("Z-UP", id="jog_negative"),
-                        Button("Z-DOWN", id="jog_positive")
-                    )
+            for axis in self._axis_order:
+                yield Static(f"Position {axis}: {self.axes[axis].get_position():.3f}mm", id=f"pos-{axis.lower()}")
+            for axis in self._axis_order:
+                yield Grid(*(Button(label, id=button_id) for label, button_id in self.JOG_BUTTONS[axis]))
         yield Label("Use + or - to change speed. Confirm when at boundary.", id="instructions")
         yield Grid(
             Button("+", id="speed_up"),
@@ -743,6 +1001,9 @@ class JogInteractively(Screen):
     def on_mount(self):
         for axis, motor in self.axes.items():
             motor.setup_jog(step_size=self.levels.get(self.starting_speed, 0.5))
+        self._jog_msg = self.query_one("#jog_msg")
+        if args.dryrun:
+            self._pos_widgets = {axis: self.query_one("#pos-"+axis.lower()) for axis in self._axis_order}
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         
@@ -750,16 +1011,16 @@ class JogInteractively(Screen):
             if event.button.id == "jog_positive":
                 axis_str = str(event.button.label)[:1]
                 self.axes[axis_str].jog(direction="+")
-                self.query_one("#pos-"+axis_str.lower()).update(f"Position {axis_str}: {self.axes[axis_str].get_position():.3f}")
+                self._pos_widgets[axis_str].update(f"Position {axis_str}: {self.axes[axis_str].get_position():.3f}")
                 return
 
             elif event.button.id == "jog_negative":
                 axis_str = str(event.button.label)[:1]
                 self.axes[axis_str].jog(direction="-")
-                self.query_one("#pos-"+axis_str.lower()).update(f"Position {axis_str}: {self.axes[axis_str].get_position():.3f}")
+                self._pos_widgets[axis_str].update(f"Position {axis_str}: {self.axes[axis_str].get_position():.3f}")
                 return
             
-        jog_msg = self.query_one("#jog_msg")
+        jog_msg = self._jog_msg
 
         if event.button.id == "speed_up":
             if self.speed < 4:
@@ -804,26 +1065,43 @@ class MoveInteractively(Screen):
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "start_stop":
             if self.running:
-                self.query_one("#message").update("E-Stop triggered.")
+                self._message.update("E-Stop triggered.")
                 self.app.action_emergency_stop(self.axes)
                 self.dismiss()
             else:
-                self.query_one("#message").update(self.move_msg)
-                self.query_one("#start_stop").label = "Stop"
+                self._message.update(self.move_msg)
+                self._start_stop.label = "Stop"
                 threading.Thread(target=self.move_func, args=(self,self.axes), daemon=True).start()
 
     def on_mount(self) -> None:
+        self._message = self.query_one("#message")
+        self._start_stop = self.query_one("#start_stop")
         if args.dryrun:
-            self.set_interval(0.1, self.update_ui)
+            self._pos_widgets = {axis: self.query_one(f"#{axis.lower()}-pos") for axis in ("X", "Y", "Z")}
+            self._last_pos = None
+            self._was_running = False
+            self._timer = self.set_interval(0.25, self.update_ui)
 
     def update_ui(self):
         if args.dryrun:
-            self.query_one("#x-pos").update(f"Position X: {self.axes['X'].get_position():.3f}mm")
-            self.query_one("#y-pos").update(f"Position Y: {self.axes['Y'].get_position():.3f}mm")
-            self.query_one("#z-pos").update(f"Position Z: {self.axes['Z'].get_position():.3f}mm")
+            positions = {axis: self.axes[axis].get_position() for axis in self._pos_widgets}
 
-async def init_axes(homing=True, app=None):
-    logger.info("Initialization of Motor Controllers.")
+            # Nothing moves anymore once the move function is done
+            if self._was_running and not self.running:
+                self._timer.stop()
+            self._was_running = self.running
+
+            if self._last_pos is not None and all(abs(positions[axis] - self._last_pos[axis]) < 1e-4 for axis in positions):
+                return
+            self._last_pos = positions
+
+            # One refresh for all three positions instead of one per axis
+            with self.app.batch_update():
+                for axis, widget in self._pos_widgets.items():
+                    widget.update(f"Position {axis}: {positions[axis]:.3f}mm")
+
+def bring_up_axes(homing=True):
+    # Connects to the motor controllers and checks their parameters. Shared by init_axes() and selfheal_axes(), raises an exception if the setup is not as expected
     found_devices = {}
 
     if args.dryrun:
@@ -838,26 +1116,25 @@ async def init_axes(homing=True, app=None):
                 if autodetect_params:
                     found_devices[axis] = Thorlabs.KinesisMotor(port, scale = "stage")
                 else:
-                    found_devices[axis] = Thorlabs.KinesisMotor(port, scale = (EncCntPerMm, SF_velocity, SF_acceleration))
+                    found_devices[axis] = Thorlabs.KinesisMotor(port, scale = _EXPECTED_SCALE)
                     found_devices[axis].setup_velocity(max_velocity=max_velocity, acceleration=acceleration)
                     if homing:
                         found_devices[axis].setup_homing
 
-                serial_no, model_no, fw_ver, hw_type, hw_ver, mod_state, nchannels, notes = found_devices[axis].get_device_info()
+                info = found_devices[axis].get_device_info()
 
-                # if serial_no != serial_number: # Broken as serial number is not correctly returned by the API
-                #     logger.error(f"Associated device with s/n {serial_number} but device returns s/n {serial_no}")
+                # if info.serial_no != serial_number: # Broken as serial number is not correctly returned by the API
+                #     logger.error(f"Associated device with s/n {serial_number} but device returns s/n {info.serial_no}")
                     # stop_event.set()
 
-                logger.info(f"   - Initialized {axis} as {model_no}v{hw_ver} (fw_ver {fw_ver}) with state {mod_state}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"   - Initialized {axis} as {info.model_no}v{info.hw_ver} (fw_ver {info.fw_ver}) with state {info.mod_state}")
 
     if not found_devices:
-        logger.error("No K-Cubes found. Aborting...")
-        return
+        raise Exception("No K-Cubes found. Aborting...")
 
     if not len(found_devices) == len(AXES_SERIAL_NUMBERS):
-        logger.error(f"Found {len(found_devices)} axes, but {len(AXES_SERIAL_NUMBERS)} were expected. Found: {list(found_devices.keys())}, expected: {list(AXES_SERIAL_NUMBERS.keys())}")
-        return
+        raise Exception(f"Found {len(found_devices)} axes, but {len(AXES_SERIAL_NUMBERS)} were expected. Found: {list(found_devices.keys())}, expected: {list(AXES_SERIAL_NUMBERS.keys())}")
 
     logger.info("Checking motor parameters")
     
@@ -871,20 +1148,17 @@ async def init_axes(homing=True, app=None):
             min_v, acc, max_v = motor.get_velocity_parameters()
             warnings=[]
 
-            if scale != (EncCntPerMm, SF_velocity, SF_acceleration):
-                logger.error(f"Axis {axis} has scale of {scale} instead of {(EncCntPerMm, SF_velocity, SF_acceleration)}. Aborting...")
-                return
+            if scale != _EXPECTED_SCALE:
+                raise Exception(f"Axis {axis} has scale of {scale} instead of {_EXPECTED_SCALE}. Aborting...")
 
             if max_v > max_velocity:
-                logger.error(f"Axis {axis} has max velocity of {max_v} instead of {max_velocity}. Aborting...")
-                return
+                raise Exception(f"Axis {axis} has max velocity of {max_v} instead of {max_velocity}. Aborting...")
 
             if max_velocity - max_v > 0.1:
                 warnings.append(f"Has max velocity of {max_v} instead of {max_velocity}")
 
             if acc > acceleration:
-                logger.error(f"Axis {axis} has acceleration of {acc} instead of {acceleration}. Aborting...")
-                return
+                raise Exception(f"Axis {axis} has acceleration of {acc} instead of {acceleration}. Aborting...")
 
             if acceleration - acc > 0.1:
                 warnings.append(f"Has acceleration of {acc} instead of {acceleration}")
@@ -897,83 +1171,28 @@ async def init_axes(homing=True, app=None):
             else:
                 logger.info(f"   - {axis}: OK ")
 
+    return found_devices
+
+async def init_axes(homing=True, app=None):
+    logger.info("Initialization of Motor Controllers.")
+
+    # Opening the controllers blocks, so keep it off the UI's event loop
+    try:
+        found_devices = await asyncio.to_thread(bring_up_axes, homing)
+    except Exception as e:
+        logger.error(f"{e}")
+        return
+
     if homing:
         await home_axes_interactively(found_devices, app=app)
 
-    if (not found_devices):
-        raise Exception("Initializing axes returned no axes")
-
     return found_devices
 
 def selfheal_axes():
-    # The init_axes() function is async because it is used as part of the Textual UI Lab Initialization.
-    # However, it is also used in other places where async is not possible, e.g., error handling while the script runs
-    # This can probably be solved in a more elegant way, but for now, we just duplicate most of init_axes' functionality here without async/await
-
+    # Same as init_axes(), but without async/await and user interaction as it is used for error handling while the script runs
     try:
         logger.info("Initialization of Motor Controllers due to selfheal.")
-        found_devices = {}
-
-        if args.dryrun:
-            found_devices = {"X": DummyAxis("X"), "Y": DummyAxis("Y"), "Z": DummyAxis("Z")}
-            logger.warning("Dry-run. Using Dummy Axes instead of real ones.")
-        else:
-            for axis, sn in AXES_SERIAL_NUMBERS.items():
-
-                port = find_tty_path(sn)
-
-                if port: 
-                    if autodetect_params:
-                        found_devices[axis] = Thorlabs.KinesisMotor(port, scale = "stage")
-                    else:
-                        found_devices[axis] = Thorlabs.KinesisMotor(port, scale = (EncCntPerMm, SF_velocity, SF_acceleration))
-                        found_devices[axis].setup_velocity(max_velocity=max_velocity, acceleration=acceleration)
-                        found_devices[axis].setup_homing
-
-                    serial_no, model_no, fw_ver, hw_type, hw_ver, mod_state, nchannels, notes = found_devices[axis].get_device_info()
-
-                    logger.info(f"   - Initialized {axis} as {model_no}v{hw_ver} (fw_ver {fw_ver}) with state {mod_state}")
-
-        if not found_devices:
-            raise Exception("No K-Cubes found. Aborting...")
-
-        if not len(found_devices) == len(AXES_SERIAL_NUMBERS):
-            raise Exception(f"Found {len(found_devices)} axes, but {len(AXES_SERIAL_NUMBERS)} were expected. Found: {list(found_devices.keys())}, expected: {list(AXES_SERIAL_NUMBERS.keys())}")
-
-        logger.info("Checking motor parameters")
-        
-        for axis, motor in found_devices.items():
-
-            if autodetect_params:
-                logger.warning(f"   - {axis}: Uses {motor.get_scale()} (autodetect, cannot determine if this is correct)")
-
-            else:
-                scale = motor.get_scale()
-                min_v, acc, max_v = motor.get_velocity_parameters()
-                warnings=[]
-
-                if scale != (EncCntPerMm, SF_velocity, SF_acceleration):
-                    raise Exception(f"Axis {axis} has scale of {scale} instead of {(EncCntPerMm, SF_velocity, SF_acceleration)}. Aborting...")
-
-                if max_v > max_velocity:
-                    raise Exception(f"Axis {axis} has max velocity of {max_v} instead of {max_velocity}. Aborting...")
-
-                if max_velocity - max_v > 0.1:
-                    warnings.append(f"Has max velocity of {max_v} instead of {max_velocity}")
-
-                if acc > acceleration:
-                    raise Exception(f"Axis {axis} has acceleration of {acc} instead of {acceleration}. Aborting...")
-
-                if acceleration - acc > 0.1:
-                    warnings.append(f"Has acceleration of {acc} instead of {acceleration}")
-
-                if not autodetect_params and motor.get_scale_units() != "user":
-                    warnings.append(f"Does indicate not to use the user-supplied values but is in range of them")
-                
-                if warnings:
-                    logger.info(f"   - {axis}: OK. Warnings: {', '.join(warnings)}")
-                else:
-                    logger.info(f"   - {axis}: OK ")
+        found_devices = bring_up_axes()
 
         home_axes(found_devices)
 
@@ -983,10 +1202,10 @@ def selfheal_axes():
         return found_devices
         
     except Exception as e:
-        tb = traceback.extract_tb(e.__traceback__)
-        if tb:
-            filename, lineno, func, text = tb[-1]
-            logger.error(f"Error while trying to selfheal axes: {filename} raised an error on line {lineno} (func {func}): {text}\n{e}")
+        frame = _last_frame(e)
+        if frame:
+            filename, lineno, func = frame
+            logger.error(f"Error while trying to selfheal axes: {filename} raised an error on line {lineno} (func {func})\n{e}")
         else:
             logger.error(f"Error while trying to selfheal axes:\n{e}")  
 
@@ -1006,18 +1225,13 @@ def deinit_axes(axes):
 async def home_axes_interactively(axes, app): 
     def perform_homing(self, axes):
         self.running = True
-        home_axes(axes)
+        home_axes(axes, homed)
         self.running = False
         self.dismiss()
     
-    requires_homing = False
+    homed = {axis: motor.is_homed() for axis, motor in axes.items()}
 
-    for axis, motor in axes.items():
-        if not motor.is_homed():
-            requires_homing = True
-            break
-
-    if requires_homing:
+    if not all(homed.values()):
         
         if app is not None:
             await app.push_screen_wait(
@@ -1028,79 +1242,97 @@ async def home_axes_interactively(axes, app):
             ))
         else:
             logger.warning("Will perform homing without user warning because no app was provided")
-            home_axes(axes)
+            home_axes(axes, homed)
     else:
         logger.info(f"No homing required")
         return
 
-def home_axes(axes):
+def home_axes(axes, homed=None):
     # The same as home_axes_interactively, but to be used by the worker threads where async/await and requesting user input is not required
     logger.info(f"Homing axes")
 
-    homeing_required = False
+    if homed is None:
+        homed = {axis: motor.is_homed() for axis, motor in axes.items()}
 
-    for axis, motor in axes.items():
-        if not motor.is_homed():
-            homeing_required = True
-            break
-
-    if not homeing_required:
+    if all(homed.values()):
         logger.info("No homing required")
         return
 
-    if axes["Z"].is_homed():
-        axes["Z"].move_to(0)
-    else:
-        axes["Z"].home()
+    # Z has to be up before any other axis moves
+    if "Z" in axes:
+        if homed["Z"]:
+            axes["Z"].move_to(0)
+            axes["Z"].wait_for_stop()
+        else:
+            axes["Z"].home()
 
+    # The remaining axes home at the same time
     for axis, motor in axes.items():
-        if not motor.is_homed():
-            motor.home()
+        if axis != "Z" and not homed[axis]:
+            motor.home(sync=False)
 
     for axis, motor in axes.items():
-        if not motor.is_homed():
+        if axis != "Z" and not homed[axis]:
             motor.wait_for_home()
 
         new_position = motor.get_position()
         logger.info(f"   - {axis}: Finished. New Position: {new_position:.5f} ")  
 
 
+_MOTOR_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=3) # One worker per axis
+
 def store_positions(axes):
     # Store all axes and their positions in CURRENT_POSITION
-    for axis, motor in axes.items():
+    global CURRENT_POSITION_TUPLE
+    def read_position(motor):
+        if (motor.is_moving()):
+            motor.wait_for_stop()
+        return motor.get_position()
+
+    for attempt in range(MAX_RETRIES):
         try:
-            if (motor.is_moving()):
-                motor.wait_for_stop()
-            CURRENT_POSITION[axis] = motor.get_position() if axis == "Z" else (motor.get_position() - REFERENCE_POINT[axis])
+            # The controllers are read out at the same time
+            futures = {axis: _MOTOR_POOL.submit(read_position, motor) for axis, motor in axes.items()}
+            for axis, future in futures.items():
+                CURRENT_POSITION[axis] = future.result() if axis == "Z" else (future.result() - REFERENCE_POINT[axis])
+            CURRENT_POSITION_TUPLE = Position(**CURRENT_POSITION)
+            return
         except Exception as e:
-            logger.error(f"{axis}-Axis: Cannot store position due to error reading the position: {e}. Resetting motors.")
+            logger.error(f"Cannot store positions due to error reading them (attempt {attempt + 1}/{MAX_RETRIES}): {e}. Resetting motors.")
             axes = selfheal_axes()
-            store_positions(axes)
 
-def retry_movement(axes, faulty_axis, position):
+    logger.error(f"Storing positions failed {MAX_RETRIES} times. Aborting at {getTime()}")
+    stop_event.set()
+
+def retry_movement(axes, faulty_axis, position, attempt=0):
     # If a motor deviates from its expected position after moving beyond a narrow threshold, we home it and try again
 
     logger.info(f"Retrying movement of axis {faulty_axis}...")
     if faulty_axis != "Z":
         # Move Z axis out of the way
         z_position = axes["Z"].get_position()
-        move(axes, {"Z": 0})
+        move(axes, {"Z": 0}, attempt=attempt)
 
     # Homing and retry movement
-    try:
-        home_axes({faulty_axis: axes[faulty_axis]})
-    except Exception as e:
-        logger.error(f"Error during homing of axis {faulty_axis}: {e}. Re-initializing axes.")
-        axes = selfheal_axes()
-        retry_movement(axes, faulty_axis, position)
+    for attempt in range(attempt, MAX_RETRIES):
+        try:
+            home_axes({faulty_axis: axes[faulty_axis]})
+            break
+        except Exception as e:
+            logger.error(f"Error during homing of axis {faulty_axis} (attempt {attempt + 1}/{MAX_RETRIES}): {e}. Re-initializing axes.")
+            axes = selfheal_axes()
+    else:
+        logger.error(f"Homing axis {faulty_axis} failed {MAX_RETRIES} times. Aborting at {getTime()}")
+        stop_event.set()
+        return
 
-    move(axes, {faulty_axis: position}, ignore_divergence=True)
+    move(axes, {faulty_axis: position}, ignore_divergence=True, attempt=attempt)
 
     if faulty_axis != "Z":
         # Return Z axis to original position
-        move(axes, {"Z": z_position})
+        move(axes, {"Z": z_position}, attempt=attempt)
 
-def move(axes, movements, ignore_divergence=False, lift_z=True, overwrite=False, relative_movement=True):
+def move(axes, movements, ignore_divergence=False, lift_z=True, overwrite=False, relative_movement=True, attempt=0):
     # Instructs motors to move according to the movements variable, a dictionary of axes and the targeted positions (e.g. "X":-2.0) in mm and relative to the REFERENCE_POINT if relative_movement is True
 
     if not (ALLOW_MOVEMENT or overwrite):
@@ -1112,93 +1344,125 @@ def move(axes, movements, ignore_divergence=False, lift_z=True, overwrite=False,
 
     overview = ' and '.join([f"{axis} to {position:.3f}mm" for axis, position in movements.items()])
     start_time = time.time()
-    logger.debug(f"Moving {overview} at {getTime()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Moving %s at %s", overview, getTime())
 
-    try:
-        # Move Z axis out of the way
-        if ("Z" in axes and "Z" not in movements and lift_z):
-            axes["Z"].move_to(BOUNDARIES["Z"]["UP"])
-            if (axes["Z"].is_moving()):
+    # Each failed attempt re-initializes the axes, bounded such that a broken controller cannot make us retry forever
+    for attempt in range(attempt, MAX_RETRIES):
+        try:
+            # Move Z axis out of the way
+            if ("Z" in axes and "Z" not in movements and lift_z):
+                axes["Z"].move_to(BOUNDARIES["Z"]["UP"])
                 axes["Z"].wait_for_stop()
 
-        axis_results = {}
-        for axis, position in movements.items():
+            for axis, position in movements.items():
 
-            relative_movement_axis = True if (relative_movement and axis != "Z") else False
+                if not isinstance(axis, str):
+                    logger.error(f"Invalid movement {movements}:\n Axis {axis} must be a string")
+                    stop_event.set()
 
-            if not isinstance(axis, str):
-                logger.error(f"Invalid movement {movements}:\n Axis {axis} must be a string")
-                stop_event.set()
+                if not isinstance(position, (int, float)):
+                    logger.error(f"Invalid movement {movements}:\n Position {position} must be a number")
+                    stop_event.set()
 
-            if not isinstance(position, (int, float)):
-                logger.error(f"Invalid movement {movements}:\n Position {position} must be a number")
-                stop_event.set()
+                if position >= max_travel:
+                    logger.error(f"Invalid movement {movements}:\n Position {position} is larger than {max_travel}mm")
+                    stop_event.set()
 
-            if position >= max_travel:
-                logger.error(f"Invalid movement {movements}:\n Position {position} is larger than {max_travel}mm")
-                stop_event.set()
+                if axis not in axes or not axes[axis].is_opened():
+                    logger.error(f"Invalid movement {movements}:\n Axis {axis} is unknown")
+                    stop_event.set()    
 
-            if axis not in axes or not axes[axis].is_opened():
-                logger.error(f"Invalid movement {movements}:\n Axis {axis} is unknown")
-                stop_event.set()    
+                if not isinstance(axes[axis], Thorlabs.kinesis.KinesisMotor) and not args.dryrun:
+                    logger.error(f"Invalid movement {movements}:\n Axis {axis} does not reference a valid motor")
+                    stop_event.set()
 
-            if not isinstance(axes[axis], Thorlabs.kinesis.KinesisMotor) and not args.dryrun:
-                logger.error(f"Invalid movement {movements}:\n Axis {axis} does not reference a valid motor")
-                stop_event.set()
+            # Axes next to each other in movements travel at the same time, but Z always moves on its own so it never crosses an X/Y move
+            phases = []
+            for axis in movements:
+                if axis == "Z" or not phases or phases[-1] == ["Z"]:
+                    phases.append([axis])
+                else:
+                    phases[-1].append(axis)
 
-            if (axes[axis].is_moving()):
-                logger.info(f"   - Waiting for {axis} to finish their prior movement ({getTime()})")
-                axes[axis].wait_for_stop()
-                logger.info(f"   - Axis {axis} finshed prior movement at {getTime()}. Executing new move command now...")
+            # Offset between the motor's coordinates and the ones in movements, resolved once per move instead of per motor command
+            offsets = {axis: REFERENCE_POINT[axis] if (relative_movement and axis != "Z") else 0.0 for axis in movements}
 
-            if relative_movement_axis:
-                axes[axis].move_to(position + REFERENCE_POINT[axis])
+            def move_axis(axis):
+                if not (relative_movement and axis != "Z"):
+                    logger.debug("Moving %s via absolute values! (position: %.3fmm, relative movement axis: False)", axis, movements[axis])
+                axes[axis].move_to(movements[axis] + offsets[axis])
+                axes[axis].wait_for_stop()
+                return axes[axis].get_position()
 
-            else:
-                logger.debug(f"Moving {axis} via absolute values! (position: {position:.3f}mm, relative movement axis: {relative_movement_axis})")
-                axes[axis].move_to(position)
+            axis_results = {}
+            for phase in phases:
 
-            if (axes[axis].is_moving()):
-                axes[axis].wait_for_stop()
+                # Each axis talks to its own controller, so they are driven from the pool at the same time
+                futures = {axis: _MOTOR_POOL.submit(move_axis, axis) for axis in phase}
+                concurrent.futures.wait(futures.values())
 
-            new_position = (axes[axis].get_position() - REFERENCE_POINT[axis]) if relative_movement_axis else axes[axis].get_position()
-            divergence = abs(position - new_position)
-            axis_results[axis] = (new_position, divergence)
+                for axis in phase:
+                    position = movements[axis]
 
-            if (divergence >= 0.01 and not ignore_divergence):
-                logger.error(f"Deviation detected! Axis {axis} finished at position {new_position:.5f}, but should have been at {position:.5f}. Divergence >= 0.01mm. Homing and trying again...")
+                    new_position = futures[axis].result() - offsets[axis]
+                    divergence = abs(position - new_position)
+                    axis_results[axis] = (new_position, divergence)
 
-                retry_movement(axes, axis, position)
-                new_position = (axes[axis].get_position() - REFERENCE_POINT[axis]) if relative_movement_axis else axes[axis].get_position()
-                divergence = abs(position - new_position)
+                    if (divergence >= 0.01 and not ignore_divergence):
+                        logger.error(f"Deviation detected! Axis {axis} finished at position {new_position:.5f}, but should have been at {position:.5f}. Divergence >= 0.01mm. Homing and trying again...")
 
-                if (divergence >= 0.01):
-                    logger.error(f"Deviation detected! Axis {axis} finished at position {new_position:.5f}, but should have been at {position:.5f}. Aborting at {getTime()} as homing did not fix the issue...")
-                    stop_event.set()
+                        retry_movement(axes, axis, position, attempt=attempt)
+                        new_position = axes[axis].get_position() - offsets[axis]
+                        divergence = abs(position - new_position)
 
-            if (axes[axis].is_moving()):
-                axes[axis].wait_for_stop()
+                        if (divergence >= 0.01):
+                            logger.error(f"Deviation detected! Axis {axis} finished at position {new_position:.5f}, but should have been at {position:.5f}. Aborting at {getTime()} as homing did not fix the issue...")
+                            stop_event.set()
 
-        # Return Z axis to lower position
-        if ("Z" in axes and "Z" not in movements and lift_z):
-            axes["Z"].move_to(BOUNDARIES["Z"]["DOWN"])
-            if (axes["Z"].is_moving()):
+            # Return Z axis to lower position
+            if ("Z" in axes and "Z" not in movements and lift_z):
+                axes["Z"].move_to(BOUNDARIES["Z"]["DOWN"])
                 axes["Z"].wait_for_stop()
 
-        logger.info(f"Moved for {time.time() - start_time:.2f}s | " + " | ".join(f"{axis} -> {axis_results[axis][0]:.3f}\t(div: +-{axis_results[axis][1]:.5f}mm)" for axis in movements))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Moved for %.2fs | %s", time.time() - start_time, " | ".join(f"{axis} -> {axis_results[axis][0]:.3f}\t(div: +-{axis_results[axis][1]:.5f}mm)" for axis in movements))
+            return
     
-    except Exception as e:
-        logger.error(f"Error during movement of {overview}: {e}. Re-initializing axes.")
-        axes = selfheal_axes()
-        move(axes, movements, ignore_divergence=ignore_divergence, lift_z=lift_z, overwrite=True, relative_movement=relative_movement)
-        return
+        except Exception as e:
+            logger.error(f"Error during movement of {overview} (attempt {attempt + 1}/{MAX_RETRIES}): {e}. Re-initializing axes.")
+            axes = selfheal_axes()
+
+    logger.error(f"Movement of {overview} failed {MAX_RETRIES} times. Aborting at {getTime()}")
+    stop_event.set()
+
 
+def _build_scan_path(start_x, start_y, direction):
+    # Precomputes the serpentine scan pattern jog() walks along. Positions lie on a STEP_SIZE grid anchored at the starting position,
+    # the first row runs from there towards `direction` and every following row starts where the previous one ended, one step further down
+    eps = 1e-9 # Positions exactly on a boundary must not be dropped due to floating point errors
+    k_right = math.ceil((BOUNDARIES["X"]["RIGHT"] - start_x) / STEP_SIZE - eps)
+    k_left = math.floor((BOUNDARIES["X"]["LEFT"] - start_x) / STEP_SIZE + eps)
+    rows = max(math.floor((start_y - BOUNDARIES["Y"]["DOWN"]) / STEP_SIZE + eps), 0) + 1
+
+    # X grid offsets (in steps) per row, the start position is always part of the first row
+    k, row_offsets = 0, []
+    for row in range(rows):
+        if direction == "right":
+            offsets = np.arange(k, min(k_right, k) - 1, -1)
+        else:
+            offsets = np.arange(k, max(k_left, k) + 1)
+        row_offsets.append(offsets)
+        k = offsets[-1]
+        direction = "left" if direction == "right" else "right"
+
+    x = start_x + np.concatenate(row_offsets) * STEP_SIZE
+    y = start_y - np.repeat(np.arange(rows), [len(offsets) for offsets in row_offsets]) * STEP_SIZE
+    return np.column_stack((x, y))
 
 def jog(axes):
     # While move() handles hardware interactions, jog() handles the logic of selecting the next position to move to according to the scan pattern and returns True if the scan is finished
 
-    global DIRECTION
-    global POS_COUNTER
     global TRIES_LEFT_PER_POSITION, FAULT_VOLTAGE, FAULT_VOLTAGE_START_AT_STEP, VARIABLE_STATE, TARGET
 
     # Reset values that are position dependent
@@ -1220,36 +1484,24 @@ def jog(axes):
     VARIABLE_STATE = 0
 
     try:
-        POS_COUNTER += 1
         FAULT_VOLTAGE_START_AT_STEP = FAULT_VOLTAGE_START
 
-        if (CURRENT_POSITION["X"] == None):
-            store_positions(axes)
+        with SCAN.lock:
+            SCAN.pos_counter += 1
 
-        # Select new position within the boundaries
-        if (
-            (DIRECTION == "right"   and CURRENT_POSITION["X"] - STEP_SIZE < BOUNDARIES["X"]["RIGHT"]) or
-            (DIRECTION == "left"    and CURRENT_POSITION["X"] + STEP_SIZE > BOUNDARIES["X"]["LEFT"])
-        ):
-            if CURRENT_POSITION["Y"] - STEP_SIZE < BOUNDARIES["Y"]["DOWN"]:
+            if SCAN.pos_counter >= len(SCAN.path):
                 # Scan is finished
                 logger.info(f"Scan finished at {getTime()}. Current position: {CURRENT_POSITION['X']:.3f}mm (X), {CURRENT_POSITION['Y']:.3f}mm (Y)")
                 return True
-            else:
-                # Continue in next row
-                if DIRECTION    == "right":
-                    DIRECTION = "left"
-                    move(axes, {"Y": CURRENT_POSITION["Y"] - STEP_SIZE})
-
-                elif DIRECTION  == "left":
-                    DIRECTION = "right"
-                    move(axes, {"Y": CURRENT_POSITION["Y"] - STEP_SIZE})
 
+            # Select new position within the boundaries
+            x, y = SCAN.path[SCAN.pos_counter]
+            previous_x, previous_y = SCAN.path[SCAN.pos_counter - 1]
+        if y != previous_y:
+            # Continue in next row
+            move(axes, {"Y": y})
         else:
-            if DIRECTION == "right":
-                move(axes, {"X": CURRENT_POSITION["X"] - STEP_SIZE})
-            elif DIRECTION == "left":
-                move(axes, {"X": CURRENT_POSITION["X"] + STEP_SIZE})
+            move(axes, {"X": x})
 
         store_positions(axes)
     except Exception as e:
@@ -1298,8 +1550,8 @@ async def setBoundaries(axes, app):
             result = await app.push_screen_wait(YesNoScreen("Do you want to load the boundaries from the last run?"))
         if result:
             try:
-                with open(BOUNDARIES_FILE, "rb") as f:
-                    boundaries = pickle.load(f)
+                with open(BOUNDARIES_FILE, "r") as f:
+                    boundaries = json.load(f)
                     BOUNDARIES = boundaries["BOUNDARIES"]
                     REFERENCE_POINT = boundaries["REFERENCE_POINT"]
                 logger.info(f"Loaded boundaries from {BOUNDARIES_FILE}")
@@ -1356,12 +1608,16 @@ async def setBoundaries(axes, app):
         msg_firstpass = "1st pass with the Z-axis out of the way. Press Enter to start."
         msg_secondpass = "2nd pass with the Z-axis in the lowered position. Press Enter to start."
 
+        # Both passes have to walk exactly the same edges
+        x_right_snap = BOUNDARIES["X"]["RIGHT"] + (BOUNDARIES["X"]["RIGHT"] % STEP_SIZE)
+        y_down_snap = BOUNDARIES["Y"]["DOWN"] + (BOUNDARIES["Y"]["DOWN"] % STEP_SIZE)
+
         def move_along_boundary_one(self, axes):
             self.running = True
             move(axes, {"Z": max(BOUNDARIES["Z"]["UP"] - 15, 0)})
             move(axes, {"X": BOUNDARIES["X"]["LEFT"], "Y": BOUNDARIES["Y"]["UP"]}, lift_z=False)                  # |`` <-
-            move(axes, {"X": (BOUNDARIES["X"]["RIGHT"] + (BOUNDARIES["X"]["RIGHT"] % STEP_SIZE))}, lift_z=False)  #  -> ``|
-            move(axes, {"Y": (BOUNDARIES["Y"]["DOWN"]  + (BOUNDARIES["Y"]["DOWN"] % STEP_SIZE))}, lift_z=False)   #  -> __|
+            move(axes, {"X": x_right_snap}, lift_z=False)                                                         #  -> ``|
+            move(axes, {"Y": y_down_snap}, lift_z=False)                                                          #  -> __|
             move(axes, {"X": BOUNDARIES["X"]["LEFT"]}, lift_z=False)                                              # |__ <-
             move(axes, {"Y": BOUNDARIES["Y"]["UP"]}, lift_z=False)                                                # |`` <-
             self.running = False
@@ -1371,97 +1627,98 @@ async def setBoundaries(axes, app):
             self.running = True
             move(axes, {"Z": BOUNDARIES["Z"]["DOWN"]})
             move(axes, {"X": BOUNDARIES["X"]["LEFT"], "Y": BOUNDARIES["Y"]["UP"]}, lift_z=False)                  # |`` <-
-            move(axes, {"X": (BOUNDARIES["X"]["RIGHT"] + (BOUNDARIES["X"]["RIGHT"] % STEP_SIZE))}, lift_z=False)  #  -> ``|
-            move(axes, {"Y": (BOUNDARIES["Y"]["DOWN"]  + (BOUNDARIES["Y"]["DOWN"] % STEP_SIZE))}, lift_z=False)   #  -> __|
+            move(axes, {"X": x_right_snap}, lift_z=False)                                                         #  -> ``|
+            move(axes, {"Y": y_down_snap}, lift_z=False)                                                          #  -> __|
             move(axes, {"X": BOUNDARIES["X"]["LEFT"]}, lift_z=False)                                              # |__ <-
             move(axes, {"Y": BOUNDARIES["Y"]["UP"]}, lift_z=False)                                                # |`` <-
             self.running = False
             self.dismiss()
 
-        await app.push_screen_wait(MoveInteractively(axes, msg + "\n" + msg_firstpass, move_along_boundary_one))
-
-        pos_x = axes["X"].get_position() - REFERENCE_POINT["X"]
-        pos_y = axes["Y"].get_position() - REFERENCE_POINT["Y"]
+        def boundaries_diverge(expected, run):
+            # Compares the TOP-LEFT corner the axes returned to with the boundaries and returns True (after logging it) if any axis is off by 0.01mm or more
+            names = list(expected)
+            target = np.array([expected[axis] for axis in names])
+            actual = np.array([axes[axis].get_position() - REFERENCE_POINT[axis] if axis != "Z" else axes[axis].get_position() for axis in names])
 
-        divergence_x = abs(BOUNDARIES["X"]["LEFT"]  - pos_x)
-        divergence_y = abs(BOUNDARIES["Y"]["UP"]    - pos_y)
+            diverged = np.abs(target - actual) >= 0.01
+            if np.any(diverged):
+                i = int(np.argmax(diverged))
+                logger.error(f"Deviation detected on validating boundaries! Axis {names[i]} finished {run}at position {actual[i]:.5f}, but should have been at {target[i]:.5f}. Aborting at {getTime()}")
+                stop_event.set()
+                return True
+            return False
 
-        if (divergence_x >= 0.01):
-            logger.error(f"Deviation detected on validating boundaries! Axis X finished at position {pos_x:.5f}, but should have been at {BOUNDARIES["X"]["LEFT"]:.5f}. Aborting at {getTime()}")
-            stop_event.set()
-            return
+        await app.push_screen_wait(MoveInteractively(axes, msg + "\n" + msg_firstpass, move_along_boundary_one))
 
-        if (divergence_y >= 0.01):
-            logger.error(f"Deviation detected on validating boundaries! Axis Y finished at position {pos_y:.5f}, but should have been at {BOUNDARIES["Y"]["UP"]:.5f}. Aborting at {getTime()}")
-            stop_event.set()
+        if boundaries_diverge({"X": BOUNDARIES["X"]["LEFT"], "Y": BOUNDARIES["Y"]["UP"]}, run=""):
             return
 
         await app.push_screen_wait(MoveInteractively(axes, msg + "\n" + msg_secondpass, move_along_boundary_two))
 
-        pos_x = axes["X"].get_position() - REFERENCE_POINT["X"]
-        pos_y = axes["Y"].get_position() - REFERENCE_POINT["Y"]
-
-        divergence_x = abs(BOUNDARIES["X"]["LEFT"]  - pos_x)
-        divergence_y = abs(BOUNDARIES["Y"]["UP"]    - pos_y)
-        divergence_z = abs(BOUNDARIES["Z"]["DOWN"]  - axes["Z"].get_position())
-
-        if (divergence_x >= 0.01):
-            logger.error(f"Deviation detected on validating boundaries! Axis X finished the second run at position {pos_x:.5f}, but should have been at {BOUNDARIES["X"]["LEFT"]:.5f}. Aborting at {getTime()}")
-            stop_event.set()
-            return
-
-        if (divergence_y >= 0.01):
-            logger.error(f"Deviation detected on validating boundaries! Axis Y finished the second run at position {pos_y:.5f}, but should have been at {BOUNDARIES["Y"]["UP"]:.5f}. Aborting at {getTime()}")
-            stop_event.set()
-            return
-
-        if (divergence_z >= 0.01):
-            logger.error(f"Deviation detected on validating boundaries! Axis Z finished the second run at position {axes["Z"].get_position():.5f}, but should have been at {BOUNDARIES["Z"]["DOWN"]:.5f}. Aborting at {getTime()}")
-            stop_event.set()
+        if boundaries_diverge({"X": BOUNDARIES["X"]["LEFT"], "Y": BOUNDARIES["Y"]["UP"], "Z": BOUNDARIES["Z"]["DOWN"]}, run="the second run "):
             return
     
         move(axes, {"Z": BOUNDARIES["Z"]["UP"]})
     
-    with open(BOUNDARIES_FILE, "wb") as f:
+    # Write to a temporary file first so an interruption cannot leave a corrupt boundaries file behind
+    with open(BOUNDARIES_FILE + ".tmp", "w") as f:
         boundaries = {
             "BOUNDARIES": BOUNDARIES,
             "REFERENCE_POINT": REFERENCE_POINT,
         }
-        pickle.dump(boundaries, f)
+        json.dump(boundaries, f, indent=4)
+    os.replace(BOUNDARIES_FILE + ".tmp", BOUNDARIES_FILE)
     logger.info(f"Successfully verified the motor boundaries and saved them to {BOUNDARIES_FILE}")   
     
     
 """ 
 ### Communication-related functions
 """
+class Sha256Digest:
+    # SHA-256 digest computed by hashlib (OpenSSL, uses SHA extensions where available), exposing what PKCS1_v1_5 needs from a Crypto.Hash object
+    oid = "2.16.840.1.101.3.4.2.1"
+    digest_size = 32
+
+    def __init__(self, data):
+        self._digest = hashlib.sha256(data).digest()
+
+    def digest(self):
+        return self._digest
+
+    def hexdigest(self):
+        return self._digest.hex()
+
+_KEYS_VERIFIED = False # the expensive consistency checks in verifyParameters() only need to pass once
+
 def onSignature(payload_str, sig_params): 
     global TRIES_LEFT_PER_POSITION, TRIES_LEFT_PER_POSITION_AND_TIME
-    global CURRENT_PROGRESS, TOTAL_PROGRESS
+    global CURRENT_PROGRESS, TOTAL_PROGRESS, PROGRESS_NBYTES
     global AXES, CS, TARGET
-    global LOOPING_COUNTER_UNPARSEABLE_SIGNATURE
     global FAULT_VOLTAGE, FAULT_VOLTAGE_START_AT_STEP, VARIABLE_STATE
-    global SIG_COUNTER, CS_DISABLED_FOR_COUNTER
     global CONFIRMED_FAULTS, SIGNATURES_PARAMS
 
-    SIG_COUNTER += 1
+    counters = COUNTERS
+    counters.total += 1
 
     if not CS.enabled:
-        logger.debug(f"Skipping signature processing as faulting is currently not allowed. disabled_for: {CS_DISABLED_FOR_COUNTER}")
-        CS_DISABLED_FOR_COUNTER += 1
-        if CS_DISABLED_FOR_COUNTER > 200:
-            logger.error(f"CS was disabled for {CS_DISABLED_FOR_COUNTER} signatures. Assuming this is an error. Re-enabling it.")
+        logger.debug("Skipping signature processing as faulting is currently not allowed. disabled_for: %d", counters.cs_disabled_for)
+        counters.cs_disabled_for += 1
+        if counters.cs_disabled_for > 200:
+            logger.error(f"CS was disabled for {counters.cs_disabled_for} signatures. Assuming this is an error. Re-enabling it.")
             CS.release_disable("CS_disabeled_timeout")
         return
 
-    CS_DISABLED_FOR_COUNTER = 0
+    counters.cs_disabled_for = 0
     TARGET.number_of_signatures += 1
     CURRENT_PROGRESS += 1
     if not ALLOW_MOVEMENT:
         TOTAL_PROGRESS += 1
+        if TOTAL_PROGRESS >> (8 * PROGRESS_NBYTES):
+            PROGRESS_NBYTES += 1
 
     if payload_str != VALID_SIGNATURE:
 
-        if len(payload_str) == len(VALID_SIGNATURE):
+        if len(payload_str) == _LEN_VALID_SIGNATURE:
             logger.info(f"Success: Found an invalid signature!")
             logger.info(f"- {payload_str}")
         else:
@@ -1470,69 +1727,60 @@ def onSignature(payload_str, sig_params):
 
         store_positions(AXES)
                
+        signature_str = payload_str.strip()
         CONFIRMED_FAULTS.append({
             "signature": payload_str,
-            "signature_str": payload_str.strip(),
-            **(sig_params or {}),
+            "signature_str": signature_str,
+            **(sig_params.as_dict() if sig_params else {}),
         })
 
-        logger.info(f"- Current position: {sig_params.get("position", {'X':-8})['X']:.3f}mm (X), {sig_params.get("position", {'Y':-8})['Y']:.3f}mm (Y), {sig_params.get("position", {'Z':-8})['Z']:.3f}mm (Z) | Measured: {sig_params.get("voltage_measured", -7)}V")
+        if sig_params is not None:
+            (x, y, z), vm = sig_params.position, sig_params.voltage_measured
+        else:
+            x, y, z, vm = -8, -8, -8, -7
+        logger.info(f"- Current position: {x:.3f}mm (X), {y:.3f}mm (Y), {z:.3f}mm (Z) | Measured: {vm}V")
 
-        SIGNATURES_PARAMS.append({
-            "result": "faulted",
-            **(sig_params or {}),
-        })
+        SIGNATURES_PARAMS.append("faulted", sig_params)
 
     else:
-        SIGNATURES_PARAMS.append({
-            "result": "valid_signature",
-            **(sig_params or {}),
-        })
+        SIGNATURES_PARAMS.append("valid_signature", sig_params)
 
-    if (VARIABLE_HIGH_TIME or VARIABLE_VOLTAGE) and TRIES_PER_POSITION >= 12:
-        
-        if VARIABLE_STATE == 0 and (TRIES_LEFT_PER_POSITION / TRIES_PER_POSITION) <= 0.66:
+    if VARIABLE_STATE < 2 and (VARIABLE_HIGH_TIME or VARIABLE_VOLTAGE) and TRIES_PER_POSITION >= 12:
+        fraction_left = TRIES_LEFT_PER_POSITION / TRIES_PER_POSITION
+
+        if VARIABLE_STATE == 0 and fraction_left <= 0.66:
 
             logger.info("First 30% at position done. Adjusting voltage and/or hightime.")
+            new_high_time, new_voltage = None, None
             
             if VARIABLE_HIGH_TIME:
-                high_time_start = sum(1 for x in FAULT_PATTERN_START if x == 1) * FAULT_PATTERN_INCREMENTS
-
-                if high_time_start >= MAX_HIGH_TIME_ns:
-                    new_high_time = high_time_start - FAULT_PATTERN_INCREMENTS
-                else:
-                    new_high_time = min(high_time_start + FAULT_PATTERN_INCREMENTS, MAX_HIGH_TIME_ns)
-                CS.change(timeHigh_ns=new_high_time)
+                new_high_time = _HIGH_TIME_STEPS[0]
 
             if VARIABLE_VOLTAGE:
                 if FAULT_VOLTAGE_START_AT_STEP >= MAX_VOLTAGE - FAULT_VOLTAGE_INCREMENTS:
                     new_voltage = FAULT_VOLTAGE_START_AT_STEP - FAULT_VOLTAGE_INCREMENTS
                 else:
                     new_voltage = min(FAULT_VOLTAGE_START_AT_STEP + FAULT_VOLTAGE_INCREMENTS, MAX_VOLTAGE)
-                CS.change(voltage=new_voltage)
 
+            # Apply both in one go, so we only wait once for the ChipSHOUTER to become ready again
+            CS.change(timeHigh_ns=new_high_time, voltage=new_voltage)
             VARIABLE_STATE = 1
 
-        elif VARIABLE_STATE == 1 and (TRIES_LEFT_PER_POSITION / TRIES_PER_POSITION) <= 0.33:
+        elif VARIABLE_STATE == 1 and fraction_left <= 0.33:
 
             logger.info("First 60% at position done. Adjusting voltage and/or hightime.")
+            new_high_time, new_voltage = None, None
 
             if VARIABLE_HIGH_TIME:
-                high_time_start = sum(1 for x in FAULT_PATTERN_START if x == 1) * FAULT_PATTERN_INCREMENTS
-
-                if high_time_start >= MAX_HIGH_TIME_ns:
-                    new_high_time = high_time_start - (2 * FAULT_PATTERN_INCREMENTS)
-                else:
-                    new_high_time = max(high_time_start - FAULT_PATTERN_INCREMENTS, MIN_HIGH_TIME_ns)
-                CS.change(timeHigh_ns=new_high_time)
+                new_high_time = _HIGH_TIME_STEPS[1]
 
             if VARIABLE_VOLTAGE:
                 if FAULT_VOLTAGE_START_AT_STEP >= MAX_VOLTAGE:
                     new_voltage = FAULT_VOLTAGE_START_AT_STEP - (2 * FAULT_VOLTAGE_INCREMENTS)
                 else:
                     new_voltage = max(FAULT_VOLTAGE_START_AT_STEP - FAULT_VOLTAGE_INCREMENTS, MIN_VOLTAGE)
-                CS.change(voltage=new_voltage)
 
+            CS.change(timeHigh_ns=new_high_time, voltage=new_voltage)
             VARIABLE_STATE = 2
         
 
@@ -1562,7 +1810,8 @@ def onSignature(payload_str, sig_params):
         return False
 
 def onMessage(payload_str, sig_params):
-    if binascii.unhexlify(payload_str) != REAL_MSG:
+    # Compare as hex strings, so a mismatch neither decodes the payload nor raises on odd lengths
+    if payload_str != _REAL_MSG_HEX and (len(payload_str) != len(_REAL_MSG_HEX) or payload_str.lower() != _REAL_MSG_HEX):
         logger.error(f"Received message does not match expected message:\n {payload_str}")
 
 def onDigest(payload_str, sig_params):
@@ -1587,32 +1836,28 @@ def onPubKey_e(payload_str, sig_params):
 
 def onTimings(payload_str, sig_params):
     global PAST_TIMINGS
-    try:
-        parts = str(payload_str).strip().split(",")
-        if len(parts) != 3:
-            logger.error(f"Invalid timing payload: {payload_str}")
-            return
-
-        # Calculate and store timing statistics for later evaluation
-        between_trigger_and_signGen_ms = int(parts[2]) - int(parts[0]) # CURRENT_TIMING["after_sign_ms"] - CURRENT_TIMING["after_trigger_ms"]
-        trigger_duration_ns = int(parts[1])
-
-        PAST_TIMINGS["between_trigger_and_signGen_ms"].append(between_trigger_and_signGen_ms)
-        PAST_TIMINGS["trigger_duration_ns"].append(trigger_duration_ns)
+    timings = _TIMING_RE.fullmatch(str(payload_str))
+    if timings is None:
+        logger.error(f"Invalid timing payload: {payload_str}")
+        return
+    after_trigger_ms, trigger_duration_ns, after_sign_ms = map(int, timings.groups())
+    if max(after_trigger_ms, trigger_duration_ns, after_sign_ms) > _TIMING_MAX:
+        logger.error(f"Timing payload out of range: {payload_str}")
+        return
 
-        # Store timing statistics in the last SIGNATURES_PARAMS entry if available
-        if SIGNATURES_PARAMS and between_trigger_and_signGen_ms and trigger_duration_ns:
-            SIGNATURES_PARAMS[-1]["between_trigger_and_signGen_ms"] = between_trigger_and_signGen_ms
-            SIGNATURES_PARAMS[-1]["trigger_duration_ns"] = trigger_duration_ns
+    # Calculate and store timing statistics for later evaluation
+    between_trigger_and_signGen_ms = after_sign_ms - after_trigger_ms
+    PAST_TIMINGS.append(between_trigger_and_signGen_ms, trigger_duration_ns)
 
-    except ValueError as e:
-        logger.error(f"Failed to parse timing payload: {payload_str}\n{e}")
+    # Store timing statistics in the last SIGNATURES_PARAMS entry if available
+    if SIGNATURES_PARAMS and between_trigger_and_signGen_ms and trigger_duration_ns:
+        SIGNATURES_PARAMS.set_last("between_trigger_and_signGen_ms", between_trigger_and_signGen_ms)
+        SIGNATURES_PARAMS.set_last("trigger_duration_ns", trigger_duration_ns)
 
 def onPause(payload_str, sig_params):
     # CS.trigger_safe # Allow ChipShouter to do self-tests. Not necessary as we do not use the hardware trigger
     logger.info("Target initiated a short break.")
-    export_params()
-    save_checkpoint()
+    request_export()
 
 def onAlarm(payload_str, sig_params):
     global CONFIRMED_ALARMS
@@ -1620,12 +1865,17 @@ def onAlarm(payload_str, sig_params):
         logger.warning("Target indicated that an alarm was triggered, but payload_str is None")
         alarms = []
     
-    if payload_str.strip() == "":
+    elif payload_str.strip() == "":
         logger.warning("Target indicated that an alarm was triggered, but payload_str is empty")
         alarms = []
 
+    elif "," not in payload_str:
+        # Usually only a single alarm is reported, which needs no splitting
+        logger.debug("Target indicated that an alarm was triggered: %s", payload_str)
+        alarms = [payload_str.strip()]
+
     else:
-        logger.debug(f"Target indicated that an alarm was triggered: {payload_str}")
+        logger.debug("Target indicated that an alarm was triggered: %s", payload_str)
         try:
             alarms = [alarm.strip() for alarm in payload_str.split(",")]
         except Exception as e:
@@ -1637,7 +1887,7 @@ def onAlarm(payload_str, sig_params):
     else:
         CONFIRMED_ALARMS.append({
             "alarms": alarms,
-            **(sig_params or {}),
+            **(sig_params.as_dict() if sig_params else {}),
         })
 
         
@@ -1690,6 +1940,7 @@ KEYWORD_HANDLERS = {
 """
 
 def verifyParameters():
+    global _KEYS_VERIFIED
     assert(CHIPSHOUTER_PORT != TARGET_PORT), "ChipShouter and TC49 must not use the same port"
     assert(BOUNDARIES["X"]["LEFT"] > BOUNDARIES["X"]["RIGHT"]), "X_BOUNDARY_LEFT must be smaller than X_BOUNDARY_RIGHT"
     assert(BOUNDARIES["Y"]["UP"] > BOUNDARIES["Y"]["DOWN"]), "Y_BOUNDARY_UP must be smaller than Y_BOUNDARY_DOWN"
@@ -1697,30 +1948,28 @@ def verifyParameters():
     assert(STEP_SIZE > 0), "STEP_SIZE must be larger than 0"
     assert(BOUNDARIES["X"]["LEFT"]  - BOUNDARIES["X"]["RIGHT"]  >= STEP_SIZE), "X-Axis: Distance between boundaries is smaller than the step-size"
     assert(BOUNDARIES["Y"]["UP"]    - BOUNDARIES["Y"]["DOWN"]   >= STEP_SIZE), "Y-Axis: Distance between boundaries is smaller than the step-size"
-    assert(DIRECTION in ["right", "left"]), "DIRECTION must be either 'right' or 'left'"
+    assert(SCAN.direction in ["right", "left"]), "STARTING_DIRECTION must be either 'right' or 'left'"
     assert(TRIES_PER_POSITION > 0), "TRIES_PER_POSITION must be larger than 0"
 
     assert("0d0a" not in VALID_SIGNATURE.lower()), "VALID_SIGNATURE must not contain the sequence '0d0a' as this is used to detect the end of a line in the serial communication"
     
     # Calculate RSA PKCS#1 v1.5 signature myself and check that it matches VALID_SIGNATURE (PKCS#1 v1.5 is deterministic)
-    hash = SHA256.new(data=REAL_MSG)
-    assert hash.hexdigest() == REAL_DIGEST, "Calculated hash does not match REAL_DIGEST"
-
-    key_pub = RSA.construct(
-        (int(REAL_SIGN_PARAMS["PubKey"]["n"], 16),
-         int(REAL_SIGN_PARAMS["PubKey"]["e"], 16)
-        ), consistency_check=True)
-    key_priv = RSA.construct(
-        (int(REAL_SIGN_PARAMS["PrivKey"]["n"], 16),
-         int(REAL_SIGN_PARAMS["PubKey"]["e"] , 16),
-         int(REAL_SIGN_PARAMS["PrivKey"]["d"], 16)
-        ), consistency_check=True)
-
-    signature = signalgo.new(key_priv).sign(hash)
-    sig_hex = binascii.hexlify(signature).decode().lower().strip()
-    assert sig_hex == VALID_SIGNATURE, "Failed trying to replicate the given Signature"
-
-    # Disabled as PKCS#1 v1.5 is deterministic
+    if not _KEYS_VERIFIED:
+        hash = Sha256Digest(REAL_MSG)
+        assert hash.hexdigest() == REAL_DIGEST, "Calculated hash does not match REAL_DIGEST"
+
+        key_priv = RSA.construct(
+            (int(REAL_SIGN_PARAMS["PrivKey"]["n"], 16),
+             int(REAL_SIGN_PARAMS["PubKey"]["e"] , 16),
+             int(REAL_SIGN_PARAMS["PrivKey"]["d"], 16)
+            ), consistency_check=True)
+
+        signature = signalgo.new(key_priv).sign(hash)
+        sig_hex = binascii.hexlify(signature).decode().lower().strip()
+        assert sig_hex == VALID_SIGNATURE, "Failed trying to replicate the given Signature"
+        _KEYS_VERIFIED = True
+
+    # Verifying with the public key is disabled as PKCS#1 v1.5 is deterministic, replicating VALID_SIGNATURE above already covers it
     # try:
     #     signalgo.new(key_pub).verify(REAL_DIGEST,VALID_SIGNATURE)
     # except Exception as e:
@@ -1799,6 +2048,38 @@ def find_tty_path(serial_number):
 ### Classes that store states and include hardware-related functions for the target and for the ChipShouter
 """
 
+class BufferedSerial:
+    """Serial port wrapper that reads whatever is waiting instead of pyserial's byte-wise read_until()."""
+    def __init__(self, ser, chunk=4096):
+        self.ser = ser
+        self.buf = bytearray()
+        self.chunk = chunk
+
+    def __getattr__(self, name):
+        return getattr(self.ser, name)
+
+    def read_until(self, expected=b'\n', size=None):
+        """Same semantics as serial.Serial.read_until(), i.e., returns on delimiter, size or timeout."""
+        deadline = None if self.ser.timeout is None else time.monotonic() + self.ser.timeout
+        searched = 0 # bytes already known not to start the delimiter, so each new chunk is only scanned once
+        while True:
+            end = self.buf.find(expected, searched)
+            if end != -1:
+                end += len(expected)
+                break
+            searched = max(0, len(self.buf) - len(expected) + 1)
+            if (size is not None and len(self.buf) >= size) or (deadline is not None and time.monotonic() >= deadline):
+                end = len(self.buf)
+                break
+            # Blocks until at least one byte arrived or the port timed out
+            self.buf += self.ser.read(min(self.chunk, max(1, self.ser.in_waiting)))
+
+        if size is not None:
+            end = min(end, size)
+        line = bytes(self.buf[:end])
+        del self.buf[:end]
+        return line
+
 class OperationalState(Enum):
     NORMAL = auto()
     FIRST_UNPARSEABLE = auto()
@@ -1812,6 +2093,10 @@ class OperationalState(Enum):
     TRYING_BAUDRATES = auto()
 
 class SerialTarget:
+    HEX_CHARS = b"0123456789abcdef"
+    KEYWORDS_WITH_PARAMS = frozenset(("Signature:", "Alarm:")) # payloads that get the current parameters attached
+    SR_ERROR_DECAY_s = 5.0 # serial errors are forgotten after this long without another one
+
     def __init__(self, port, baudrate, device, event_queue, stop_event):
         global CS
         self.port = port
@@ -1819,7 +2104,10 @@ class SerialTarget:
         self.alternative_baudrate = ALTERNATIVE_BAUDRATE
         self.device = device
         self.ser = None
+        self.arduino_ser = None # kept open between resets, see _arduino_connection()
+        self.unparseable_file = None # kept open while listening, see _unparseable_file()
         self.event_queue = event_queue
+        self._emit = event_queue.put # bound once, called for every parseable line
         self.stop_event = stop_event
         self.cs = CS
         
@@ -1841,10 +2129,11 @@ class SerialTarget:
         self.number_of_unparseables_at_position_and_voltage_in_a_row = 0
         self.number_of_empty = 0
         self.number_of_sr_errors = 0
+        self.time_last_sr_error = 0.0
         self.number_of_recovery_attempts_at_position_and_voltage = 0
         
         # Message parsing configuration
-        self.signature_byte_length = len(binascii.unhexlify(VALID_SIGNATURE))
+        self.signature_byte_length = len(_EXPECTED_SIG)
         self.max_read_length = self.signature_byte_length * 2
         
     def _load_header_config(self):
@@ -1865,73 +2154,73 @@ class SerialTarget:
             global DUMMY_TARGET
             self.ser = DUMMY_TARGET
         else:
-            self.ser = serial.Serial(
+            self.ser = BufferedSerial(serial.Serial(
                 port if port else self.port, 
                 baudrate if baudrate else self.baudrate, 
                 timeout=(EXPECTED_DURATION_SIG_GEN_ms / 1000 * 2)
-            )
+            ))
     
     def _is_parseable_string(self, payload_str, allowed_length, allowed_chars):
-        """Check if a string is parseable based on length and character constraints."""
-        invalid_chars = sum(1 for c in payload_str if c not in allowed_chars)
+        """Check if a string or raw line is parseable based on length and character constraints (allowed_chars as bytes)."""
         length_diff = abs(len(payload_str) - allowed_length)
-        
         max_length_diff = max(1, allowed_length * 0.1)
+        if length_diff > max_length_diff:
+            return False
+
+        # Deleting the allowed characters leaves the invalid ones, "replace" keeps one byte per non-ASCII character
+        payload_bytes = payload_str if isinstance(payload_str, bytes) else payload_str.encode("ascii", "replace")
+        invalid_chars = len(payload_bytes.translate(None, allowed_chars))
         max_invalid_chars = max(1, len(payload_str) * 0.4)
         
-        return not (length_diff > max_length_diff or invalid_chars > max_invalid_chars)
-    
-    def _is_timings(self, s):
-        """Check if string represents timing data."""
-        return (len(s.split(",")) == 3 and 
-                all(part.strip().isdigit() for part in s.split(",")))
-    
-    def _is_alarm(self, s):
-        """Check if string represents an alarm message."""
-        return any(alarm in s for alarm in ALARMS_DEFINED)
+        return not invalid_chars > max_invalid_chars
     
     def _serial_to_string(self, payload):
         """Convert serial payload to parseable string."""
-        parseable_checks = [
-            lambda s: s in KEYWORD_HANDLERS,
-            # lambda s: self._is_parseable_string(s, len(VALID_SIGNATURE), "0123456789abcdef"), sent as binary data
-            lambda s: self._is_timings(s),
-            lambda s: self._is_alarm(s),
-            lambda s: s in "for 30sec",
-            lambda s: self._is_parseable_string(s, len(REAL_MSG), "0123456789abcdef"),
-            lambda s: self._is_parseable_string(s, len(REAL_DIGEST), "0123456789abcdef"),
-            lambda s: self._is_parseable_string(s, len(REAL_SIGN_PARAMS["PrivKey"]["n"]), "0123456789abcdef"),
-            lambda s: self._is_parseable_string(s, len(REAL_SIGN_PARAMS["PrivKey"]["d"]), "0123456789abcdef"),
-            lambda s: self._is_parseable_string(s, len(REAL_SIGN_PARAMS["PubKey"]["n"]), "0123456789abcdef"),
-            lambda s: self._is_parseable_string(s, len(REAL_SIGN_PARAMS["PubKey"]["e"]), "0123456789abcdef"),
-        ]
-
         if not isinstance(payload, bytes):
             logger.error(f"Received payload of type {type(payload)}. Expected bytes.")
             return False, None
             
         payload_str = ""
-        prefix_location = payload.find(PREFIX)
+        # Well-formed signature frames start with the prefix, so only search the whole frame if they do not
+        prefix_location = 0 if payload.startswith(PREFIX) else payload.find(PREFIX)
 
         if prefix_location != -1:  # Message contains prefix, assume signature
-            logger.debug(f"Found prefix, assuming signature ({payload[:8]}...)")
-            payload = payload[prefix_location + len(PREFIX):]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Found prefix, assuming signature ({payload[:8]}...)")
             
             try:
-                payload_str = binascii.hexlify(payload).decode("ascii")
-                payload_str = payload_str.rstrip("0d0a").strip()
+                # Hex-encode straight from a view on the buffer instead of copying everything after the prefix first
+                payload_str = memoryview(payload)[prefix_location + _LEN_PREFIX:].hex()
+                # Only drop the line ending itself, rstrip("0d0a") would also eat trailing 0, a and d digits of the signature
+                if payload_str.endswith("0d0a"):
+                    payload_str = payload_str[:-4]
                 return True, payload_str
             except Exception:
                 logger.error("Error converting payload to string")
                 return False, None
         else:  # No signature prefix
-            logger.debug(f"Found no prefix, assuming an encoded string ({payload[:8]}...)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Found no prefix, assuming an encoded string ({payload[:8]}...)")
             
             try:
-                payload_str = payload.decode(errors="replace")
-                payload_str = payload_str.rstrip("\r\n").strip()
-                
-                if payload_str != "" and any(check(payload_str) for check in parseable_checks):
+                # Regular UART output is plain ASCII, only faulted lines need the replacing UTF-8 decoder
+                if payload.isascii():
+                    payload_str = payload.decode("ascii").strip()
+                else:
+                    payload_str = payload.decode(errors="replace").strip()
+
+                if payload_str == "":
+                    return False, payload_str
+
+                if (
+                    payload_str in KEYWORD_HANDLERS or
+                    # Signatures are sent as binary data and handled above
+                    _LINE_RE.match(payload_str) is not None or
+                    payload_str in "for 30sec" or
+                    # A single lookup replaces one check per expected hex string, as the character check only depends on the string itself.
+                    # The check runs on the raw line instead of encoding the decoded string again
+                    (len(payload_raw := payload.strip()) in _HEX_STRING_LENGTHS and self._is_parseable_string(payload_raw, len(payload_raw), self.HEX_CHARS))
+                ):
                     return True, payload_str
                 else:
                     return False, payload_str
@@ -1939,6 +2228,29 @@ class SerialTarget:
                 logger.error("Error converting payload to string")
                 return False, None
 
+    def _arduino_connection(self):
+        """Return the Arduino connection, opening it on first use."""
+        if self.arduino_ser is None:
+            # Configure before opening, so DTR stays low and does not restart the Arduino on every open
+            arduino = serial.Serial()
+            arduino.port = ARDUINO_PORT
+            arduino.baudrate = ARDUINO_BAUDRATE
+            arduino.timeout = 10
+            arduino.dtr = False
+            arduino.open()
+            # Some drivers still pulse DTR when the port is opened, so wait for the bootloader once per session
+            time.sleep(3)
+            self.arduino_ser = arduino
+        return self.arduino_ser
+
+    def _close_arduino(self):
+        if self.arduino_ser is not None:
+            try:
+                self.arduino_ser.close()
+            except Exception:
+                pass
+            self.arduino_ser = None
+
     def reset(self):
         """Reset the target device."""
         try:
@@ -1953,36 +2265,41 @@ class SerialTarget:
                 else:
                     self.target_state = OperationalState.STARTED_FIRST_RESET
 
-                logger.debug(f"Reset changed the state to {self.target_state}")           
-
-                if args.dryrun:
-                    if args.realtarget:
-                        logger.warning("Dry-run with real target. Skipping actual reset command as Arduino is emulated but target is not.")
-                        return
-                    
-                    logger.debug("Trying to reset dummy target")
-                    global DUMMY_TARGET
-                    DUMMY_TARGET.reset()
-                    logger.info("This is a dry-run. Reset dummy target.")
+                logger.debug("Reset changed the state to %s", self.target_state)
 
-                else:
-                    arduino = serial.Serial(ARDUINO_PORT, ARDUINO_BAUDRATE, timeout=10)
-                    time.sleep(3)
+            # The reset itself takes several seconds, so do not block the listener meanwhile
+            if args.dryrun:
+                if args.realtarget:
+                    logger.warning("Dry-run with real target. Skipping actual reset command as Arduino is emulated but target is not.")
+                    return
+                
+                logger.debug("Trying to reset dummy target")
+                global DUMMY_TARGET
+                DUMMY_TARGET.reset()
+                logger.info("This is a dry-run. Reset dummy target.")
 
-                    arduino.write("reset\n".encode())
-                    res = arduino.readline().decode('utf-8').strip()
+            else:
+                arduino = self._arduino_connection()
+                arduino.reset_input_buffer()
+                arduino.write(b"reset\n")
+                res = arduino.readline().decode('utf-8').strip()
 
-                    if SHOW_UART:
-                        logger.info(f"ARDUINO | {res}")
+                if SHOW_UART:
+                    logger.info(f"ARDUINO | {res}")
 
-                    if res == "reset":
-                        logger.info("Arduino reports that it will reset the target now.")
-                    else:
-                        raise Exception(f"Arduino reported: {res}")
+                if res == "reset":
+                    logger.info("Arduino reports that it will reset the target now.")
+                else:
+                    raise Exception(f"Arduino reported: {res}")
 
         except Exception as e:
             logger.error(f"Failed to reset target: {e}")
-            self.cs.release_disable("target_reset")
+            # Reopen the Arduino connection on the next reset, it might have been unplugged
+            self._close_arduino()
+            # The listener may already have finished the reset and released the ChipSHOUTER, do not release another reason
+            with self.cs._lock:
+                if "target_reset" in self.cs.disable_requests:
+                    self.cs.release_disable("target_reset")
 
     def _handle_reset_state(self, line_str):
         """Handle target reset state detection and management."""
@@ -1995,7 +2312,7 @@ class SerialTarget:
 
             # Check if reset is over
             reset_complete = (
-                (self.banner_provided and line_str.strip() in self.header_last_part) or
+                (self.banner_provided and line_str in self.header_last_part) or
                 ((time.time() - self.time_last_reset) > MAX_TIME_REQUIRED_FOR_TARGET_RESET_in_s)
             )
             
@@ -2016,15 +2333,18 @@ class SerialTarget:
     def _complete_reset(self, line_str):
         """Complete the reset process and update state."""
         self.time_last_reset = None
+        self._flush_unparseable_file()
 
         self.target_state = (OperationalState.AFTER_FIRST_RESET if self.target_state == OperationalState.IN_FIRST_RESET 
                                                                 else OperationalState.AFTER_SECOND_RESET)
 
-        if "target_reset" in self.cs.disable_requests:
-            self.cs.release_disable("target_reset")
+        # reset() releases it as well if the Arduino failed, so check and release in one step
+        with self.cs._lock:
+            if "target_reset" in self.cs.disable_requests:
+                self.cs.release_disable("target_reset")
 
-        if line_str.strip() in self.header_last_part:
-            logger.debug(f"Detected end of reset based on line: {line_str}")
+        if line_str in self.header_last_part:
+            logger.debug("Detected end of reset based on line: %s", line_str)
 
         elif self.target_state != OperationalState.AFTER_SECOND_RESET:
             logger.warning(f"Reset timeout reached. Resetting again...")
@@ -2036,7 +2356,7 @@ class SerialTarget:
 
     def _detect_target_reset(self, line_str):
         """Detect if target has been reset."""
-        if not self.banner_provided or line_str.strip() not in self.header_first_part:
+        if not self.banner_provided or line_str not in self.header_first_part:
             return False
         
         if self.target_state == OperationalState.STARTED_FIRST_RESET:
@@ -2051,7 +2371,7 @@ class SerialTarget:
             # self.reset()
             self.target_state = OperationalState.IN_FIRST_RESET
 
-        logger.debug(f"Detected reset of target based on line: {line_str}")
+        logger.debug("Detected reset of target based on line: %s", line_str)
         if SHOW_UART:
             logger.info(f"TARGET | Reset: {line_str}")
         return True
@@ -2059,17 +2379,13 @@ class SerialTarget:
     def _log_unparseable(self, result="unparseable_without_reason"): # undefined
         global SIGNATURES_PARAMS
         sig_params = self._gather_signature_params()
-        SIGNATURES_PARAMS.append({
-            "result": result,
-            **(sig_params or {}),
-        })
+        SIGNATURES_PARAMS.append(result, sig_params)
+        sig_params.release()
 
     def _append_last_param(self, result):
         """Log unexpected reset event."""
         global SIGNATURES_PARAMS
-        if len(SIGNATURES_PARAMS) > 0:
-            SIGNATURES_PARAMS[-1]["result"] = result
-        else:
+        if not SIGNATURES_PARAMS.set_last("result", result):
             logger.warning("Tried to append last parameter but SIGNATURES_PARAMS is empty. This should not happen.")
 
     def _gather_signature_params(self):
@@ -2085,13 +2401,12 @@ class SerialTarget:
         except Exception as e:
             logger.warning(f"Tried to get voltage and pattern from CS to store but got {type(e)} instead ('{e}'). Storing the global values instead.")
 
-        sig_params = {
-            "position": CURRENT_POSITION.copy(),
-            "time": getTime(date=True),
-            "voltage_set": voltage_set,
-            "voltage_measured": voltage_measured,
-            "pattern": fault_pattern,
-        }
+        sig_params = SigParams.acquire()
+        sig_params.position = CURRENT_POSITION_TUPLE # immutable, so it can be shared without copying
+        sig_params.time = getTime(date=True)
+        sig_params.voltage_set = voltage_set
+        sig_params.voltage_measured = voltage_measured
+        sig_params.pattern = fault_pattern
 
         return sig_params
 
@@ -2099,57 +2414,51 @@ class SerialTarget:
     def _handle_parseable_message(self, line_str):
         """Handle parseable messages and keywords."""
         sig_params = None
+        # Keywords are sent on a line of their own, so a single dict lookup identifies them. _serial_to_string() already stripped the line
+        is_keyword = line_str in KEYWORD_HANDLERS
         if self.buffer is not None:  # Previous line was a keyword
 
-            if line_str and line_str.strip() in KEYWORD_HANDLERS:
-                logger.debug(f"Received keyword twice in succession ({line_str.strip()}, buffered: {self.buffer.strip()}). Ignoring.")
+            if is_keyword:
+                logger.debug("Received keyword twice in succession (%s, buffered: %s). Ignoring.", line_str, self.buffer)
 
             else:
-                if self.buffer == "Signature:" or self.buffer == "Alarm:":
+                if self.buffer in self.KEYWORDS_WITH_PARAMS:
                     sig_params = self._gather_signature_params()
 
-                self.event_queue.put((self.device, self.buffer, line_str, sig_params))
+                self._emit((self.device, self.buffer, line_str, sig_params))
 
             self.buffer = None
             
-        elif line_str.strip() in KEYWORD_HANDLERS:
-            self.buffer = line_str.strip()
+        elif is_keyword:
+            self.buffer = line_str
 
-        elif self._is_timings(line_str):
-            logger.info(f"Received no keyword but asserted that the payload must be timings: {line_str[:min(10,len(line_str))]}...")
-            self.event_queue.put((self.device, "Timings:", line_str, sig_params))
+        elif (line_class := _LINE_RE.match(line_str)) is not None:
+            keyword, description = _LINE_CLASSES[line_class.lastgroup]
+            logger.info(f"Received no keyword but asserted that {description}: {line_str[:10]}...")
+            self._emit((self.device, keyword, line_str, sig_params))
 
-        elif self._is_alarm(line_str):
-            logger.info(f"Received no keyword but asserted that the payload must be an alarm: {line_str[:min(10,len(line_str))]}...")
-            self.event_queue.put((self.device, "Alarm:", line_str, sig_params))
-
-        elif line_str == "for 30sec":
-            logger.info(f"Received no keyword but asserted that target initiated a pause: {line_str[:min(10,len(line_str))]}...")
-            self.event_queue.put((self.device, "Pause:", line_str, sig_params))
-        
-        elif self._is_parseable_string(line_str, len(VALID_SIGNATURE), "0123456789abcdef"):
-            logger.info(f"Received no keyword but asserted that the payload must be a signature: {line_str[:min(10,len(line_str))]}...")
+        elif self._is_parseable_string(line_str, _LEN_VALID_SIGNATURE, self.HEX_CHARS):
+            logger.info(f"Received no keyword but asserted that the payload must be a signature: {line_str[:10]}...")
             sig_params = self._gather_signature_params()
-            self.event_queue.put((self.device, "Signature:", line_str, sig_params))
+            self._emit((self.device, "Signature:", line_str, sig_params))
 
         else:
-            logger.debug(f"Received parseable line with no prior keyword: {line_str}")
-            self.event_queue.put((self.device, None, line_str, sig_params))
+            logger.debug("Received parseable line with no prior keyword: %s", line_str)
+            self._emit((self.device, None, line_str, sig_params))
 
     def _handle_unparseable_message(self, line_str, line):
-        """Handle unparseable messages and update counters."""
+        """Handle unparseable messages and update counters. Returns whether the line should be stored."""
         global BASENAME_FILES, TOTAL_PROGRESS, CURRENT_PROGRESS
         
         self.number_of_unparseables += 1
         self.number_of_unparseables_at_position_and_voltage += 1
         self.number_of_unparseables_at_position_and_voltage_in_a_row += 1
 
-        if (self.target_state != OperationalState.NORMAL and 
-            self.target_state != OperationalState.FIRST_UNPARSEABLE):
-            logger.debug(f"Received unparseable signature while in state {self.target_state}. Will not store it.")
+        store_line = self.target_state in (OperationalState.NORMAL, OperationalState.FIRST_UNPARSEABLE)
+        if store_line:
+            logger.debug("Received unparseable signature: %s | %s", line_str, line)
         else:
-            logger.debug(f"Received unparseable signature: {line_str} | {line}")
-            self._save_unparseable_signature(line)
+            logger.debug("Received unparseable signature while in state %s. Will not store it.", self.target_state)
 
         
         if self.number_of_unparseables_at_position_and_voltage_in_a_row >= 6:
@@ -2185,25 +2494,43 @@ class SerialTarget:
                 self.number_of_recovery_attempts_at_position_and_voltage += 1
 
         self._check_voltage_reduction()
+        return store_line
+
+    def _unparseable_file(self):
+        """Return the file for unparseable signatures, (re)opening it if there is none yet or the basename changed."""
+        path = BASENAME_FILES + "_unparseable.raw"
+        if self.unparseable_file is None or self.unparseable_file.name != path:
+            self._close_unparseable_file()
+            self.unparseable_file = open(path, "ab", buffering=64 * 1024)
+        return self.unparseable_file
+
+    def _close_unparseable_file(self):
+        if self.unparseable_file is not None:
+            self.unparseable_file.close()
+            self.unparseable_file = None
+
+    def _flush_unparseable_file(self):
+        if self.unparseable_file is not None:
+            self.unparseable_file.flush()
 
     def _save_unparseable_signature(self, line):
         """Save unparseable signature to file."""
-        try:
-            with open(BASENAME_FILES + "_unparseable.raw", "ab") as f:
-                num_bytes = (int(TOTAL_PROGRESS).bit_length() + 7) // 8
-                progress_bytes = int(CURRENT_PROGRESS).to_bytes(num_bytes, byteorder='big')
-                f.write((b'\xff' + b'\x00')*2 + progress_bytes + (b'\xff' + b'\x00')*2 + line)
-        except (OverflowError, ValueError) as e:
-            # Fallback: use a larger fixed size 
-            logger.warning(f"Failed to save unparseable signature with progress {CURRENT_PROGRESS}: {e}. Using 8-byte fallback.")
-            try:
-                progress_bytes = int(CURRENT_PROGRESS).to_bytes(8, byteorder='big')
-                f.write((b'\xff' + b'\x00')*2 + progress_bytes + (b'\xff' + b'\x00')*2 + line)
-            except (OverflowError, ValueError) as e2:
-                # Last resort: save without progress bytes
-                logger.error(f"Cannot save progress bytes even with 8 bytes: {e2}. Saving signature without progress.")
-                progress_bytes = b'\x00'*8
-                f.write((b'\xff' + b'\x00')*2 + progress_bytes + (b'\xff' + b'\x00')*2 + line)
+        progress = CURRENT_PROGRESS
+        if 0 <= progress and not progress >> (8 * PROGRESS_NBYTES):
+            progress_bytes = progress.to_bytes(PROGRESS_NBYTES, byteorder='big')
+        elif 0 <= progress < 1 << 64:
+            # Fallback: use a larger fixed size
+            logger.warning(f"Progress {progress} does not fit into {PROGRESS_NBYTES} bytes. Using 8-byte fallback.")
+            progress_bytes = progress.to_bytes(8, byteorder='big')
+        else:
+            # Last resort: save without progress bytes
+            logger.error(f"Cannot save progress {progress} even with 8 bytes. Saving signature without progress.")
+            progress_bytes = b'\x00'*8
+
+        record = _UNPARSEABLE_SEPARATOR + progress_bytes + _UNPARSEABLE_SEPARATOR + line
+        # Only the buffered write holds the lock, export_faults_and_map() closes the file under it
+        with target_lock:
+            self._unparseable_file().write(record)
 
     def _check_voltage_reduction(self):
         """Check if voltage should be reduced due to unparseable messages."""
@@ -2212,6 +2539,7 @@ class SerialTarget:
         
         if self.number_of_unparseables_at_position_and_voltage >= max(TRIES_PER_POSITION // 3, 10):
             logger.info(f"Received {self.number_of_unparseables_at_position_and_voltage} unparseable messages. Lowering voltage.")
+            self._flush_unparseable_file()
             self.number_of_unparseables_at_position_and_voltage = 0
             self.number_of_unparseables_at_position_and_voltage_in_a_row = 0
             TRIES_LEFT_PER_POSITION = TRIES_PER_POSITION
@@ -2258,7 +2586,7 @@ class SerialTarget:
         """Reset state machine when parseable message received."""
         if parseable and self.target_state != OperationalState.NORMAL:
             logger.info("Resuming normal operations as parseable message was received")
-            logger.debug(f"Message that changed state: {line_str}")
+            logger.debug("Message that changed state: %s", line_str)
 
             self.number_of_unparseables_at_position_and_voltage_in_a_row = 0
             
@@ -2279,14 +2607,15 @@ class SerialTarget:
 
     def _handle_serial_error(self, e):
         """Handle serial communication errors."""
-        tb = traceback.extract_tb(e.__traceback__)
-        if tb:
-            filename, lineno, func, text = tb[-1]
-            logger.error(f"Serial error ({type(e)}) on {self.device}: {filename}:{lineno} {text}, '{e}'")
+        frame = _last_frame(e)
+        if frame:
+            filename, lineno, func = frame
+            logger.error(f"Serial error ({type(e)}) on {self.device}: {filename}:{lineno} (func {func}), '{e}'")
         else:
             logger.error(f"Serial error ({type(e)}) on {self.device}: {e}")
 
         self.number_of_sr_errors += 1
+        self.time_last_sr_error = time.monotonic()
         if self.number_of_sr_errors > 10:
             self._handle_critical_error()
 
@@ -2321,6 +2650,7 @@ class SerialTarget:
                             line = line[:self.max_read_length] + b'\r\n'
                         
                         parseable, line_str = self._serial_to_string(line)
+                        store_line = False
                         
                         with target_lock:
 
@@ -2346,13 +2676,17 @@ class SerialTarget:
                             if parseable:
                                 self._handle_parseable_message(line_str)
                             else:
-                                self._handle_unparseable_message(line_str, line)
+                                store_line = self._handle_unparseable_message(line_str, line)
                             
                             # Update state machine
                             self._update_state_machine(parseable)
                             
                             # Check for state machine reset
                             self._reset_state_machine(parseable, line_str)
+
+                        # Writing the line does not touch shared state, so it happens after releasing the lock
+                        if store_line:
+                            self._save_unparseable_signature(line)
                     else:
                         self._handle_empty_lines()
                         
@@ -2360,11 +2694,76 @@ class SerialTarget:
                     self._handle_serial_error(e)
                     continue
                 else:
-                    if random.random() < 0.2:
+                    # Errors only count towards a target reset while they keep coming
+                    if self.number_of_sr_errors and time.monotonic() - self.time_last_sr_error > self.SR_ERROR_DECAY_s:
                         self.number_of_sr_errors = 0
                         
         finally:
             self.ser.close()
+            self._close_arduino()
+            self._close_unparseable_file()
+
+@functools.lru_cache(maxsize=None)
+def build_fault_pattern(no_of_ones):
+    # Delay (zeros), high-side (ones) and a trailing zero. Only a few distinct patterns are used during a test, so they are built once
+    no_of_zeros = 66 - no_of_ones
+    return (0,) * no_of_zeros + (1,) * no_of_ones + (0,)
+
+def valid_high_time(timeHigh_ns):
+    if not isinstance(timeHigh_ns, int) or timeHigh_ns < 0:
+        logger.error("timeHigh_ns must be a positive integer")
+        return False
+    if timeHigh_ns > MAX_HIGH_TIME_ns:
+        logger.error(f"timeHigh_ns can't be larger than {MAX_HIGH_TIME_ns} ns")
+        return False
+    return True
+
+def valid_voltage(voltage):
+    if not isinstance(voltage, (int, float)) or voltage < 0:
+        logger.error("Voltage must be a positive number")
+        return False
+    if voltage < MIN_VOLTAGE or voltage > MAX_VOLTAGE:
+        logger.error(f"Voltage must be between {MIN_VOLTAGE} and {MAX_VOLTAGE}V")
+        return False
+    if (voltage // 30) + 1 > DEAD_TIME:
+        logger.warning(f"Voltage not set because it might be to high. ChipSHOUTER charges 30V/ms in the worst case. Based on the current dead-time ({DEAD_TIME} ms), the voltage should be lower than {DEAD_TIME * 30} V to ensure it can properly pulse")
+        return False
+    return True
+
+def valid_deadtime(deadtime, voltage):
+    # voltage is the one that will be in effect together with this dead-time
+    if not isinstance(deadtime, int) or deadtime < 0:
+        logger.error("Deadtime must be a positive number")
+        return False
+    if deadtime < 1 or deadtime > 1000:
+        logger.error(f"Deadtime must be between 1 and 1000 ms")
+        return False
+    if deadtime < (voltage // 30) + 1:
+        logger.warning(f"Deadtime not set because it might be to low. ChipSHOUTER charges 30V/ms in the worst case. Based on the current voltage ({voltage}V), the deadtime should be at least {(voltage // 30) + 1} ms to ensure it can properly pulse")
+        return False
+    return True
+
+def _cs_ready_pool():
+    return concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="cs_ready")
+
+_CS_POOL = _cs_ready_pool() # Runs ready_for_commands() so it can time out
+
+@functools.lru_cache(maxsize=None)
+def summarize_pattern(pattern):
+    # Leading zeros, ones and whether a zero follows them. The pattern only changes with the high time, so few distinct ones are seen
+    values = np.asarray(pattern)
+    not_zero = values != 0
+    num_zeros = int(np.argmax(not_zero)) if not_zero.any() else values.size
+    not_one = values[num_zeros:] != 1
+    num_ones = int(np.argmax(not_one)) if not_one.any() else values.size - num_zeros
+    trailing_zero = bool(values.size > num_zeros + num_ones and values[num_zeros + num_ones] == 0)
+    return num_zeros, num_ones, trailing_zero
+
+class SelfhealCheck(Enum):
+    # Checks of CS_Connector.selfheal() in the order they are run. A check that fails twice in a row leads to a reset
+    CONNECTION = auto()
+    FAULT = auto()
+    ARM = auto()
 
 class CS_Connector:
     def __init__(self, port=None, serial_number=None):
@@ -2372,32 +2771,46 @@ class CS_Connector:
         self.port = port or CHIPSHOUTER_PORT
         self.serial_number = serial_number or CHIPSHOUTER_SERIAL_NUMBER
         self._chipshouter = None
-        self.disable_requests = []
+        self.disable_requests = {} # reason -> number of pending requests, in the order they were first made
         self.enabled = False
+        self.selfheal_step = 0 # backoff step reached by the last selfheal
+        self.time_last_selfheal = float("-inf")
+        self.pat_wave_sent = None # Pattern the ChipSHOUTER is known to hold, None if unknown
         self.connect()
 
     def __getattr__(self, name):
 
-        if name in ("_chipshouter", "_lock", "port", "serial_number", "disable_requests", "enabled"):
+        if name in ("_chipshouter", "_lock", "port", "serial_number", "disable_requests", "enabled", "selfheal_step", "time_last_selfheal", "pat_wave_sent"):
             return object.__getattribute__(self, name)
 
         with object.__getattribute__(self, "_lock"):
-            try:                
-                attr = getattr(self._chipshouter, name)
+            try:
+                # Methods are returned bound to the ChipSHOUTER as they are, calling them does not hold the lock either way
+                return getattr(self._chipshouter, name)
 
-                if callable(attr): # if the attribute is a method
-                    def wrapper(*args, **kwargs):
-                        return attr(*args, **kwargs)
-                    return wrapper
-                
-                return attr
-            
             except Exception as e:
                 self.handleException(e, msg=f"accessing '{name}'", retry_fun=self.__getattr__, retry_args=(name,), part_of_exception_handling=True)
 
+    # voltage and pat_wave are read for every signature, so they get properties instead of going through __getattr__
+    @property
+    def voltage(self):
+        with self._lock:
+            try:
+                return self._chipshouter.voltage
+            except Exception as e:
+                self.handleException(e, msg="accessing 'voltage'", retry_fun=self.__getattr__, retry_args=("voltage",), part_of_exception_handling=True)
+
+    @property
+    def pat_wave(self):
+        with self._lock:
+            try:
+                return self._chipshouter.pat_wave
+            except Exception as e:
+                self.handleException(e, msg="accessing 'pat_wave'", retry_fun=self.__getattr__, retry_args=("pat_wave",), part_of_exception_handling=True)
+
     def __setattr__(self, name, value):
 
-        if name in {"_chipshouter", "_lock", "port", "serial_number", "disable_requests", "enabled"}:
+        if name in {"_chipshouter", "_lock", "port", "serial_number", "disable_requests", "enabled", "selfheal_step", "time_last_selfheal", "pat_wave_sent"}:
             super().__setattr__(name, value)
             return
 
@@ -2423,13 +2836,13 @@ class CS_Connector:
         else:
             if isinstance(e, Reset_Exception):
                 logger.warning(f"Caught ChipSHOUTER 'Reset Exception'{f' {msg}' if msg else ''}. Reconnecting...")
-                logger.debug(f"Exception details: {e}")
+                logger.debug("Exception details: %s", e)
                 time.sleep(5)
                 self.reconnect(part_of_exception_handling=True)
 
             elif isinstance(e, Max_Retry_Exception):
                 logger.error(f"Caught ChipSHOUTER 'Max Retry Exception'{f' {msg}' if msg else ''}. Starting selfheal...")
-                logger.debug(f"Exception details: {e}")
+                logger.debug("Exception details: %s", e)
                 self.selfheal(part_of_exception_handling=True)
 
             else:
@@ -2475,9 +2888,9 @@ class CS_Connector:
                 self.arm(False, reason)
 
             else:
-                logger.debug(f"Tried to disable ChipShouter with reason {reason} while it is already disabled. Pending disable requests: {self.disable_requests}")
+                logger.debug("Tried to disable ChipShouter with reason %s while it is already disabled. Pending disable requests: %s", reason, self.disable_requests)
 
-            self.disable_requests.append(reason)
+            self.disable_requests[reason] = self.disable_requests.get(reason, 0) + 1
 
     def release_disable(self, reason=""):
         with self._lock:
@@ -2486,17 +2899,23 @@ class CS_Connector:
                 logger.warning(f"Tried to enable ChipShouter with reason {reason} but there are no disable requests pending. This should not happen, will enable ChipShouter anyway.")
             
             elif reason in self.disable_requests:
-                self.disable_requests.remove(reason)
+                self._drop_disable_request(reason)
 
             else:
                 logger.warning(f"Disable request with reason '{reason}' does not exist: {self.disable_requests}. Removing the last element...")
-                self.disable_requests.pop()
+                self._drop_disable_request(next(reversed(self.disable_requests)))
 
             if len(self.disable_requests) == 0:
                 self.arm(True, reason)
 
             else:
-                logger.debug(f"Tried to enable ChipShouter with reason {reason} but it still has disable requests pending: {self.disable_requests}. Not enabling it yet.")
+                logger.debug("Tried to enable ChipShouter with reason %s but it still has disable requests pending: %s. Not enabling it yet.", reason, self.disable_requests)
+
+    def _drop_disable_request(self, reason):
+        if self.disable_requests[reason] > 1:
+            self.disable_requests[reason] -= 1
+        else:
+            del self.disable_requests[reason]
 
     def getInfo(self, part_of_exception_handling=False):
          
@@ -2559,6 +2978,7 @@ class CS_Connector:
                     return
                 
                 i += 1
+                self.pat_wave_sent = None
 
                 try:
                     if args.dryrun:
@@ -2568,9 +2988,10 @@ class CS_Connector:
                         self._chipshouter = ChipSHOUTER(self.port)
 
                 except Exception as e:
-                    logger.error(f"{type(e)} while connecting to ChipSHOUTER: {e}. Trying to get the correct port and retrying in {5 * i} s, {3 - i} tries left...")
+                    delay = backoff(i)
+                    logger.error(f"{type(e)} while connecting to ChipSHOUTER: {e}. Trying to get the correct port and retrying in {delay:.1f} s, {3 - i} tries left...")
                     self.find_port()
-                    time.sleep(5 * i)
+                    time.sleep(delay)
                     continue
 
                 else:
@@ -2578,8 +2999,9 @@ class CS_Connector:
                         logger.info(f"Connected to ChipSHOUTER.")
                         return
                     else:
-                        logger.warning(f"Failed to connect to ChipSHOUTER. Retrying in {5 * i} s, {3 - i} tries left...")
-                        time.sleep(5 * i)
+                        delay = backoff(i)
+                        logger.warning(f"Failed to connect to ChipSHOUTER. Retrying in {delay:.1f} s, {3 - i} tries left...")
+                        time.sleep(delay)
 
     # Connects, initializes, and arms the ChipShouter while connect() does just the connecting
     def reconnect(self, part_of_exception_handling=False):
@@ -2601,17 +3023,20 @@ class CS_Connector:
                 self.reset()
 
     def ready_for_commands_with_timeout(self, timeout=5, retry_fun=None, retry_args=None, part_of_exception_handling=False):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(self._chipshouter.ready_for_commands)
-            try:
-                future.result(timeout=timeout)
+        global _CS_POOL
+        future = _CS_POOL.submit(self._chipshouter.ready_for_commands)
+        try:
+            future.result(timeout=timeout)
 
-            except concurrent.futures.TimeoutError:
-                logger.error("ready_for_commands() timed out after 5 seconds. Executing selfheal().")
-                self.selfheal()
+        except concurrent.futures.TimeoutError:
+            # The hung call keeps the only worker busy. Later checks (e.g., by the selfheal below) get a new one instead of queueing behind it
+            _CS_POOL.shutdown(wait=False)
+            _CS_POOL = _cs_ready_pool()
+            logger.error(f"ready_for_commands() timed out after {timeout} seconds. Executing selfheal().")
+            self.selfheal()
 
-            except Exception as e:
-                self.handleException(e, msg="ready_for_commands", retry_fun=retry_fun, retry_args=retry_args, part_of_exception_handling=part_of_exception_handling)
+        except Exception as e:
+            self.handleException(e, msg="ready_for_commands", retry_fun=retry_fun, retry_args=retry_args, part_of_exception_handling=part_of_exception_handling)
 
     def initialize(self, part_of_exception_handling=False):
 
@@ -2622,33 +3047,32 @@ class CS_Connector:
 
                 self.ready_for_commands_with_timeout(10, retry_fun=self.initialize, part_of_exception_handling=part_of_exception_handling)
                 
-                self._chipshouter.armed = 0
+                cs = self._chipshouter
+                cs.armed = 0
 
-                self._chipshouter.pat_wave = FAULT_PATTERN
-                self._chipshouter.voltage = FAULT_VOLTAGE
-                self._chipshouter.pulse.deadtime = DEAD_TIME
-                self._chipshouter.pat_enable = 1
-                self._chipshouter.pulse.repeat = 1
+                self.pat_wave_sent = None
+                cs.pat_wave = FAULT_PATTERN
+                self.pat_wave_sent = tuple(FAULT_PATTERN)
+                cs.voltage = FAULT_VOLTAGE
+                cs.pulse.deadtime = DEAD_TIME
+                cs.pat_enable = 1
+                cs.pulse.repeat = 1
 
-                self._chipshouter.hwtrig_term = 1
-                self._chipshouter.hwtrig_mode = 1
-                self._chipshouter.emode = 0
+                cs.hwtrig_term = 1
+                cs.hwtrig_mode = 1
+                cs.emode = 0
 
-                self._chipshouter.mute = 1
-                self._chipshouter.arm_timeout = 20 # minutes
+                cs.mute = 1
+                cs.arm_timeout = 20 # minutes
 
                 self.ready_for_commands_with_timeout(10, retry_fun=self.initialize, part_of_exception_handling=part_of_exception_handling)
                 
-                # Summarize the pattern: count leading zeros, ones, and trailing zero
-                pattern = self._chipshouter.pat_wave
-                num_zeros = next((i for i, v in enumerate(pattern) if v != 0), len(pattern))
-                num_ones = next((i for i, v in enumerate(pattern[num_zeros:]) if v != 1), len(pattern) - num_zeros)
-                trailing_zero = (len(pattern) > num_zeros + num_ones and pattern[num_zeros + num_ones] == 0)
-
-                logger.info(f"Initialized ChipSHOUTER with board id {str(self._chipshouter.id).strip()} and api version {self._chipshouter.api_version}")
-                logger.info(f"   - Voltage: {self._chipshouter.voltage.set} V")
+                num_zeros, num_ones, trailing_zero = summarize_pattern(tuple(cs.pat_wave))
+
+                logger.info(f"Initialized ChipSHOUTER with board id {str(cs.id).strip()} and api version {cs.api_version}")
+                logger.info(f"   - Voltage: {cs.voltage.set} V")
                 logger.info(f"   - Pattern: {num_zeros} zeros, {num_ones} ones" + (", trailing zero" if trailing_zero else ""))
-                logger.info(f"   - Pulse repeat: {self._chipshouter.pulse.repeat}")
+                logger.info(f"   - Pulse repeat: {cs.pulse.repeat}")
 
         except Exception as e:
             self.handleException(e, msg=f"initializing ChipSHOUTER", retry_fun=self.initialize, part_of_exception_handling=part_of_exception_handling)
@@ -2660,7 +3084,7 @@ class CS_Connector:
 
         if arm and len(self.disable_requests) > 0:
             logger.warning(f"Overwriting the disable queue: {self.disable_requests}. Consider using release_disable() instead!")
-            self.disable_requests = []
+            self.disable_requests = {}
 
         self.enabled = arm
         logger.info(f"Trying to {req_txt} ChipShouter ({reason})")
@@ -2688,8 +3112,9 @@ class CS_Connector:
                     self._chipshouter.armed = arm
 
                 except Exception as e:
-                    logger.error(f"{type(e)} while {req_txt} the ChipSHOUTER: {e}. Retrying in {5 * i} s, {3 - i} tries left...")
-                    time.sleep(5 * i)
+                    delay = backoff(i)
+                    logger.error(f"{type(e)} while {req_txt} the ChipSHOUTER: {e}. Retrying in {delay:.1f} s, {3 - i} tries left...")
+                    time.sleep(delay)
                     continue
 
                 else:
@@ -2709,8 +3134,9 @@ class CS_Connector:
 
 
                     except Exception as e2:
-                        logger.error(f"{type(e2)} while checking if ChipSHOUTER is {req}: {e2}. Retrying in {5 * i} s, {3 - i} tries left...")
-                        time.sleep(5 * i)
+                        delay = backoff(i)
+                        logger.error(f"{type(e2)} while checking if ChipSHOUTER is {req}: {e2}. Retrying in {delay:.1f} s, {3 - i} tries left...")
+                        time.sleep(delay)
                         continue
 
     def reset(self, part_of_exception_handling=False):
@@ -2720,14 +3146,16 @@ class CS_Connector:
                 # Resetting ChipSHOUTER
                 logger.info("Resetting ChipSHOUTER and reconnecting...")
 
-                i = 1
+                i = 0
                 while True:
+                    i += 1
                     try:
                         self._chipshouter.reset = 1
 
                     except (OSError, IOError) as e:
-                        logger.error(f"{type(e)} while setting reset bit on ChipSHOUTER: {e}. Retrying in {5 * i} s until this works...")
-                        time.sleep(5 * i)
+                        delay = backoff(i)
+                        logger.error(f"{type(e)} while setting reset bit on ChipSHOUTER: {e}. Retrying in {delay:.1f} s until this works...")
+                        time.sleep(delay)
 
                         try:
                             self.connect()
@@ -2744,8 +3172,9 @@ class CS_Connector:
                             self.connect()
 
                         except Exception as e:
-                            logger.error(f"{type(e)} while connecting to ChipSHOUTER after reset: {e}. Retrying in {5 * i} s until this works...")
-                            time.sleep(5 * i)
+                            delay = backoff(i)
+                            logger.error(f"{type(e)} while connecting to ChipSHOUTER after reset: {e}. Retrying in {delay:.1f} s until this works...")
+                            time.sleep(delay)
                             continue
 
                         else:
@@ -2754,15 +3183,16 @@ class CS_Connector:
                                 self.reconnect()
                                 return
                             else:
-                                logger.error(f"Although connect() raised no Exception, is_connected() retured False! Retrying in {5 * i} s until this works...")
-                                time.sleep(5 * i)
+                                delay = backoff(i)
+                                logger.error(f"Although connect() raised no Exception, is_connected() retured False! Retrying in {delay:.1f} s until this works...")
+                                time.sleep(delay)
                                 continue
 
         except Exception as e:
-            tb  = traceback.extract_tb(e.__traceback__)
-            if tb:
-                filename, lineno, func, text = tb[-1]
-                logger.error(f"{type(e)} while resetting ChipSHOUTER: {filename} raised an error on line {lineno} (func {func}): {text}, '{e}'")
+            frame = _last_frame(e)
+            if frame:
+                filename, lineno, func = frame
+                logger.error(f"{type(e)} while resetting ChipSHOUTER: {filename} raised an error on line {lineno} (func {func}), '{e}'")
             else:
                 logger.error(f"{type(e)} while resetting ChipSHOUTER: {e}.")
 
@@ -2803,13 +3233,24 @@ class CS_Connector:
                     self.reset()
                     return
 
+    def _reset_if_failed_twice(self, check, failed_on):
+        # A repair that did not help the first time is not tried again, the ChipSHOUTER is reset instead
+        if check is not failed_on:
+            return False
+        logger.error(f"ChipSHOUTER Selftest failed twice on the same check: {check.name.lower()}. Resetting ChipShouter")
+        self.reset()
+        return True
+
     def selfheal(self, part_of_exception_handling=False):
-        failed_on=""
+        failed_on = None # SelfhealCheck whose repair was triggered last
         i = 0
+        # If the last selfheal was only just now, continue its backoff instead of starting short again
+        step = self.selfheal_step if time.monotonic() - self.time_last_selfheal < 30 else 0
         while True:
             if i > 20:
                 logger.error(f"Selfheal ran for {i} times in a row without success. This seems unrecoverable. Exiting...")
                 stop_event.set()
+                return False
 
             i += 1
 
@@ -2818,57 +3259,55 @@ class CS_Connector:
 
                     if not self.is_connected():
                         logger.warning("Selftest found: ChipSHOUTER is not connected.")
-                        if failed_on == "connection":
-                            logger.error(f"ChipSHOUTER Selftest failed twice on the same check: {failed_on}. Resetting ChipShouter")
-                            self.reset()
-                            continue
-                        else:
-                            logger.info("Selfheal triggered: Reconnecting...")
-                            failed_on = "connection"
-                            self.reconnect(part_of_exception_handling=part_of_exception_handling)
+                        if self._reset_if_failed_twice(SelfhealCheck.CONNECTION, failed_on):
                             continue
+                        logger.info("Selfheal triggered: Reconnecting...")
+                        failed_on = SelfhealCheck.CONNECTION
+                        self.reconnect(part_of_exception_handling=part_of_exception_handling)
+                        continue
 
 
                     logger.debug("selfheal reports ChipSHOUTER as connected")
 
-                    if self._chipshouter.state == 'fault':
+                    # Every state read is a serial round-trip, so it is only read again after clear_faults changed it
+                    state = self._chipshouter.state
+                    if state == 'fault':
                         logger.warning("Selftest found: ChipSHOUTER reports state 'fault'.")
-                        if failed_on == "fault":
-                            logger.error(f"ChipSHOUTER Selftest failed twice on the same check: {failed_on}. Resetting ChipShouter")
-                            self.reset()
+                        if self._reset_if_failed_twice(SelfhealCheck.FAULT, failed_on):
                             continue
-                        else:
-                            logger.info("Selfheal triggered: Clearing faults...")
-                            failed_on = "fault"
-                            self.clear_faults()
+                        logger.info("Selfheal triggered: Clearing faults...")
+                        failed_on = SelfhealCheck.FAULT
+                        self.clear_faults()
+                        state = self._chipshouter.state
 
                     logger.debug("selfheal reports ChipSHOUTER as not in fault state")
 
-                    if (self.enabled and self._chipshouter.state == 'disarmed') or (not self.enabled and self._chipshouter.state == 'armed'):
+                    if state == ('disarmed' if self.enabled else 'armed'):
                         logger.warning(f"Selftest found: ChipSHOUTER is falsefully {'armed' if self.enabled else 'disarmed'}.")
-                        if failed_on == "arm":
-                            logger.error(f"ChipSHOUTER Selftest failed twice on the same check: {failed_on}. Resetting ChipShouter")
-                            self.reset()
+                        if self._reset_if_failed_twice(SelfhealCheck.ARM, failed_on):
                             continue
-                        else:
-                            logger.info(f"Selfheal triggered: {'arming' if self.enabled else 'disarming'}...")
-                            failed_on = "arm"
-                            self.arm(self.enabled, "selfheal", part_of_exception_handling=part_of_exception_handling)
+                        logger.info(f"Selfheal triggered: {'arming' if self.enabled else 'disarming'}...")
+                        failed_on = SelfhealCheck.ARM
+                        self.arm(self.enabled, "selfheal", part_of_exception_handling=part_of_exception_handling)
 
             except Exception as e:
-                tb  = traceback.extract_tb(e.__traceback__)
-                if tb:
-                    filename, lineno, func, text = tb[-1]
-                    logger.error(f"Caught {type(e)} during CS selfheal: {filename} raised an error on line {lineno} (func {func}): {text}, '{e}'. Retrying in {5 * i} s, {20 - i} tries left...")
+                delay = backoff(step)
+                step += 1
+                frame = _last_frame(e)
+                if frame:
+                    filename, lineno, func = frame
+                    logger.error(f"Caught {type(e)} during CS selfheal: {filename} raised an error on line {lineno} (func {func}), '{e}'. Retrying in {delay:.1f} s, {20 - i} tries left...")
                 else:
-                    logger.error(f"Caught {type(e)} during CS selfheal: {e}. Retrying in {5 * i} s, {20 - i} tries left...")
+                    logger.error(f"Caught {type(e)} during CS selfheal: {e}. Retrying in {delay:.1f} s, {20 - i} tries left...")
 
-                time.sleep(5 * i)
+                time.sleep(delay)
                 self.reset()
                 continue
             
             else:
-                if failed_on == "":
+                self.time_last_selfheal = time.monotonic()
+                self.selfheal_step = step
+                if failed_on is None:
                     logger.debug("ChipSHOUTER selftest returned positive. No selfheal was required.")
                     return True
                 else:
@@ -2881,65 +3320,56 @@ class CS_Connector:
     def change(self, timeHigh_ns=None, voltage=None, deadtime=None, silent=False, part_of_exception_handling=False):
         global FAULT_PATTERN, FAULT_VOLTAGE, DEAD_TIME, TARGET
 
+        # Invalid values are logged and skipped before taking the lock, the valid ones are still applied
+        if timeHigh_ns is not None and not valid_high_time(timeHigh_ns):
+            timeHigh_ns = None
+        if voltage is not None and not valid_voltage(voltage):
+            voltage = None
+        if deadtime is not None and not valid_deadtime(deadtime, FAULT_VOLTAGE if voltage is None else voltage):
+            deadtime = None
+
         try:
             with self._lock:
 
                 if timeHigh_ns is not None:
-                    if not isinstance(timeHigh_ns, int) or timeHigh_ns < 0:
-                        logger.error("timeHigh_ns must be a positive integer")
+                    no_of_ones = timeHigh_ns // MIN_HIGH_TIME_ns
+                    if no_of_ones <= 0:
+                        self.request_disable("user")
                     else:
-                        if timeHigh_ns > MAX_HIGH_TIME_ns:
-                            logger.error(f"timeHigh_ns can't be larger than {MAX_HIGH_TIME_ns} ns")
-                        else:
-                            no_of_ones = timeHigh_ns // MIN_HIGH_TIME_ns
-                            if no_of_ones <= 0:
-                                self.request_disable("user")
+                        no_of_zeros = 66 - no_of_ones
+                        pattern = build_fault_pattern(no_of_ones)
+                        FAULT_PATTERN = list(pattern)
+
+                        # Skip the write and read-back if the ChipSHOUTER already has this pattern
+                        if pattern != self.pat_wave_sent:
+                            self.pat_wave_sent = None # Unknown until the read-back confirms it
+                            self._chipshouter.pat_wave = FAULT_PATTERN
+
+                            if ''.join(map(str, pattern)) == str(self._chipshouter.pat_wave).strip():
+                                self.pat_wave_sent = pattern
+                                if not silent: logger.info(f"Changed fault pattern to have a delay of {no_of_zeros*MIN_HIGH_TIME_ns} ns and high-side of {no_of_ones*MIN_HIGH_TIME_ns} ns")
                             else:
-                                no_of_zeros = 66 - no_of_ones
-
-                                FAULT_PATTERN = [0] * no_of_zeros + [1] * no_of_ones + [0]
-                                self._chipshouter.pat_wave = FAULT_PATTERN
-
-                                if ''.join(str(x) for x in FAULT_PATTERN) == str(self._chipshouter.pat_wave).strip():
-                                    if not silent: logger.info(f"Changed fault pattern to have a delay of {no_of_zeros*MIN_HIGH_TIME_ns} ns and high-side of {no_of_ones*MIN_HIGH_TIME_ns} ns")
-                                else:
-                                    logger.error(f"Tried to set fault pattern to {FAULT_PATTERN} but CS reports {self._chipshouter.pat_wave}")
+                                logger.error(f"Tried to set fault pattern to {FAULT_PATTERN} but CS reports {self._chipshouter.pat_wave}")
 
                 if voltage is not None:
-                    if not isinstance(voltage, (int, float)) or voltage < 0:
-                        logger.error("Voltage must be a positive number")
+                    TARGET.number_of_unparseables_at_position_and_voltage = 0
+                    TARGET.number_of_recovery_attempts_at_position_and_voltage = 0
+                    FAULT_VOLTAGE = voltage
+                    self._chipshouter.voltage = voltage
+
+                    if float(self._chipshouter.voltage.set) == FAULT_VOLTAGE:
+                        if not silent: logger.info(f"Changed fault voltage to {FAULT_VOLTAGE} V")
                     else:
-                        if voltage < MIN_VOLTAGE or voltage > MAX_VOLTAGE:
-                            logger.error(f"Voltage must be between {MIN_VOLTAGE} and {MAX_VOLTAGE}V")
-                        elif (voltage // 30) + 1 > DEAD_TIME:
-                            logger.warning(f"Voltage not set because it might be to high. ChipSHOUTER charges 30V/ms in the worst case. Based on the current dead-time ({DEAD_TIME} ms), the voltage should be lower than {DEAD_TIME * 30} V to ensure it can properly pulse")
-                        else:
-                            TARGET.number_of_unparseables_at_position_and_voltage = 0
-                            TARGET.number_of_recovery_attempts_at_position_and_voltage = 0
-                            FAULT_VOLTAGE = voltage
-                            self._chipshouter.voltage = voltage
-                            
-                            if float(self._chipshouter.voltage.set) == FAULT_VOLTAGE:
-                                if not silent: logger.info(f"Changed fault voltage to {FAULT_VOLTAGE} V")
-                            else:
-                                logger.error(f"Tried to set fault voltage to {FAULT_VOLTAGE}V but CS reports {self._chipshouter.voltage.set} V")
+                        logger.error(f"Tried to set fault voltage to {FAULT_VOLTAGE}V but CS reports {self._chipshouter.voltage.set} V")
 
                 if deadtime is not None:
-                    if not isinstance(deadtime, int) or deadtime < 0:
-                        logger.error("Deadtime must be a positive number")
-                    else:
-                        if deadtime < 1 or deadtime > 1000:
-                            logger.error(f"Deadtime must be between 1 and 1000 ms")
-                        elif deadtime < (FAULT_VOLTAGE // 30) + 1:
-                            logger.warning(f"Deadtime not set because it might be to low. ChipSHOUTER charges 30V/ms in the worst case. Based on the current voltage ({FAULT_VOLTAGE}V), the deadtime should be at least {(FAULT_VOLTAGE // 30) + 1} ms to ensure it can properly pulse")
-                        else:
-                            DEAD_TIME = deadtime
-                            self._chipshouter.pulse.deadtime = deadtime
+                    DEAD_TIME = deadtime
+                    self._chipshouter.pulse.deadtime = deadtime
 
-                            if int(self._chipshouter.pulse.deadtime) == deadtime:
-                                if not silent: logger.info(f"Changed dead-time to {deadtime} ms")
-                            else:
-                                logger.error(f"Tried to set deadtime to {deadtime} ms but CS reports {int(self._chipshouter.pulse.deadtime)} ms")
+                    if int(self._chipshouter.pulse.deadtime) == deadtime:
+                        if not silent: logger.info(f"Changed dead-time to {deadtime} ms")
+                    else:
+                        logger.error(f"Tried to set deadtime to {deadtime} ms but CS reports {int(self._chipshouter.pulse.deadtime)} ms")
 
                 self.ready_for_commands_with_timeout(10, retry_fun=self.change, retry_args=(timeHigh_ns, voltage, deadtime, silent), part_of_exception_handling=part_of_exception_handling)
 
@@ -2962,7 +3392,7 @@ def list_checkpoints():
             checkpoints.append((f, "corrupt"))
     return checkpoints
 
-def save_checkpoint():
+def checkpoint_bytes():
     checkpoint = {
         "BOUNDARIES": BOUNDARIES,
         "CURRENT_POSITION": CURRENT_POSITION,
@@ -2976,9 +3406,21 @@ def save_checkpoint():
         "TARGET_NAME": TARGET_NAME,
         "checkpoint_time": getTime(date=True)
     }
-    with open(CHECKPOINT_FILE, "wb") as f:
-        pickle.dump(checkpoint, f)
-    logger.info(f"Saved checkpoint at {checkpoint['checkpoint_time']}")
+    return pickle.dumps(checkpoint, protocol=pickle.HIGHEST_PROTOCOL)
+
+def write_checkpoint(data):
+    # Written next to the checkpoint and renamed over it, so a crash mid-write leaves the previous checkpoint intact
+    tmp_file = CHECKPOINT_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, CHECKPOINT_FILE)
+    logger.info(f"Saved checkpoint at {getTime(date=True)}")
+
+def save_checkpoint():
+    export_queue.join() # A checkpoint still queued by export_loop() must not overwrite this one afterwards
+    write_checkpoint(checkpoint_bytes())
 
 class LoadBoundariesDisplay(ModalScreen):
 
@@ -3007,14 +3449,12 @@ class LoadBoundariesDisplay(ModalScreen):
 """ 
 ### Functions that export results during target-initiated pauses or at the end
 """
-def export_params():
-    # export params and whether they resulted in parseable, unparseable, or faulted signatures
-    global SIGNATURES_PARAMS
-    
+def write_params(rows):
+    # Appends the given parameter rows to the CSV file and returns whether that succeeded
     try:
-        if len(SIGNATURES_PARAMS) == 0:
+        if len(rows) == 0:
             logger.info("No parameters tried. Skipping export of parameters.")
-            return
+            return True
         
         csv_params_filename = TARGET_NAME + "_parameter_collection_v5.csv"
         file_exists = os.path.exists(csv_params_filename)
@@ -3022,41 +3462,135 @@ def export_params():
 
         with open(csv_params_filename, "a", newline="") as csvfile:
 
-            fieldnames = ["time", "result", "x", "y", "z", "voltage_set", "voltage_measured", "between_trigger_and_signGen_ms", "trigger_duration_ns", "tip_diameter_mm", "tip_winding", "pattern"]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.writer(csvfile)
             if write_header:
-                writer.writeheader()
-            for params in SIGNATURES_PARAMS:
-                pos = params.get("position", {})
-                writer.writerow({
-                    "time": params.get("time", getTime(date=True)),
-                    "result": params.get("result"),
-                    "x": pos.get("X"),
-                    "y": pos.get("Y"),
-                    "z": pos.get("Z"),
-                    "voltage_set": params.get("voltage_set"),
-                    "voltage_measured": params.get("voltage_measured"),
-                    "between_trigger_and_signGen_ms": params.get("between_trigger_and_signGen_ms", ""),
-                    "trigger_duration_ns": params.get("trigger_duration_ns", ""),
-                    "tip_diameter_mm": TIP_USED.get("diameter_mm"),
-                    "tip_winding": TIP_USED.get("winding"),
-                    "pattern": params.get("pattern") #''.join(str(x) for x in params.get("pattern", [])),
-                })
+                writer.writerow(("time", "result", *SignatureParams.COLUMNS, "tip_diameter_mm", "tip_winding", "pattern"))
+            tip_diameter_mm = TIP_USED.get("diameter_mm")
+            tip_winding = TIP_USED.get("winding")
+            writer.writerows((time or getTime(date=True), *values, tip_diameter_mm, tip_winding, pattern) for time, *values, pattern in rows)
             logger.info(f"Exported tried parameters to {csv_params_filename}")
 
     except Exception as e:
         logger.error(f"Failed to export parameters: {e}")
+        return False
     
-    else:
-        SIGNATURES_PARAMS = []
+    return True
+
+def export_params():
+    # export params and whether they resulted in parseable, unparseable, or faulted signatures
+    export_queue.join() # Rows handed to export_loop() earlier have to end up in the file first
+    if write_params(list(SIGNATURES_PARAMS.rows())):
+        SIGNATURES_PARAMS.clear()
+
+export_queue = queue.Queue() # Exports requested during target-initiated pauses, written by export_loop()
+
+def request_export():
+    # Snapshots a checkpoint on the calling thread and leaves the disk I/O to export_loop(). The recorded parameters are not
+    # converted here: the filled buffers are handed over as a whole and recording continues in fresh ones
+    export_queue.put_nowait(("params", SIGNATURES_PARAMS.take()))
+    export_queue.put_nowait(("checkpoint", checkpoint_bytes()))
+
+def export_loop():
+    # Background thread writing what request_export() queued. Everything that piled up meanwhile is written at once,
+    # i.e., all parameter rows in a single append and only the newest checkpoint
+    pending_rows = []
+    while True:
+        jobs = [export_queue.get()]
+        while True:
+            try:
+                jobs.append(export_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        checkpoint = None
+        try:
+            for kind, data in jobs:
+                if kind == "params":
+                    pending_rows.extend(data.rows())
+                else:
+                    checkpoint = data
+
+            if pending_rows and write_params(pending_rows):
+                pending_rows = [] # Otherwise, try again with the next export
+            if checkpoint is not None:
+                write_checkpoint(checkpoint)
+        except Exception as e:
+            logger.error(f"Failed to write queued export: {e}")
+        finally:
+            for _ in jobs:
+                export_queue.task_done()
+
+def next_free_filename(filename):
+    # Returns filename, or filename with _2, _3, ... after the highest suffix already taken. The directory is scanned once instead of probing each candidate
+    if not os.path.exists(filename):
+        return filename
+
+    directory, name = os.path.split(filename)
+    stem, ext = os.path.splitext(name)
+    suffix_re = re.compile(rf"{re.escape(stem)}_(\d+){re.escape(ext)}")
+    highest = 1
+    with os.scandir(directory or ".") as entries:
+        for entry in entries:
+            match = suffix_re.fullmatch(entry.name)
+            if match:
+                highest = max(highest, int(match.group(1)))
+
+    return os.path.join(directory, f"{stem}_{highest + 1}{ext}")
+
+def position_xyz(entry):
+    pos = entry.get("position", {})
+    return pos.get("X"), pos.get("Y"), pos.get("Z")
+
+def save_heatmap(entries, x_bins, y_bins, colorbar_label, title, path):
+    # Alarms raised before the first signature (e.g., during a target reset) have no position
+    entries = [entry for entry in entries if entry.get("position")]
+
+    # Extract x and y coordinates of the faults or alarms in one pass
+    points = np.fromiter((coordinate for entry in entries for coordinate in (entry["position"]["X"], entry["position"]["Y"])),
+                         dtype=np.float64, count=2 * len(entries)).reshape(-1, 2)
+    x_points, y_points = points[:, 0], points[:, 1]
+
+    # Create 2D histogram
+    hist, _, _ = np.histogram2d(x_points, y_points, bins=[x_bins, y_bins])
+
+    plt.figure(figsize=(10, 8))
+
+    # Plot heatmap
+    plt.imshow(hist.T,  # Transpose to match coordinate system
+            extent=[BOUNDARIES["X"]["RIGHT"], BOUNDARIES["X"]["LEFT"],
+                    BOUNDARIES["Y"]["DOWN"], BOUNDARIES["Y"]["UP"]],
+            origin='lower',  # Place (0,0) at bottom left
+            aspect='auto',
+            cmap='hot',
+            interpolation='gaussian')
+
+    # Invert x-axis because that is how our motors are set up
+    plt.gca().invert_xaxis()
+
+    plt.colorbar(label=colorbar_label)
+    plt.xlabel('X Position (mm)')
+    plt.ylabel('Y Position (mm)')
+    plt.title(title)
+
+    # Show grid
+    plt.grid(True, alpha=0.3)
+    plt.scatter(x_points, y_points, color='blue', alpha=0.5, s=20)
+
+    plt.savefig(path)
+    plt.close()
 
 def export_faults_and_map(resolution=50):
+    export_queue.join() # A checkpoint still queued by export_loop() must not reappear after the checkpoint was moved
 
     csv_results_filename = None
     csv_alarm_filename = None
     results_mapname = None
     alarm_mapname = None
 
+    # Both maps share one grid
+    x_bins = np.linspace(BOUNDARIES["X"]["RIGHT"], BOUNDARIES["X"]["LEFT"], resolution)
+    y_bins = np.linspace(BOUNDARIES["Y"]["DOWN"], BOUNDARIES["Y"]["UP"], resolution)
+
     if len(CONFIRMED_FAULTS) == 0:
         logger.info("No faults found. Skipping export of results and fault map.")
     else:
@@ -3065,87 +3599,26 @@ def export_faults_and_map(resolution=50):
             # 1. Write CSV
             csv_results_filename = BASENAME_FILES + "_results.csv"
 
-            if os.path.exists(csv_results_filename):
-
-                i = 2
-                while os.path.exists(csv_results_filename[:-4] + "_" + str(i) + ".csv"):
-                    i += 1
-
-                csv_results_filename = csv_results_filename + "_" + str(i) + ".csv"
+            csv_results_filename = next_free_filename(csv_results_filename)
 
             with open(csv_results_filename, "w", newline="") as csvfile:
-                fieldnames = ["x", "y", "z", "time", "voltage_set", "voltage_measured", "pattern", "signature"]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                for fault in CONFIRMED_FAULTS:
-                    pos = fault.get("position", {})
-                    writer.writerow({
-                        "x": pos.get("X"),
-                        "y": pos.get("Y"),
-                        "z": pos.get("Z"),
-                        "time": fault.get("time"),
-                        "voltage_set": fault.get("voltage_set"),
-                        "voltage_measured": fault.get("voltage_measured"),
-                        "pattern": fault.get("pattern"),
-                        "signature": fault.get("signature"),
-                    })
+                writer = csv.writer(csvfile)
+                writer.writerow(("x", "y", "z", "time", "voltage_set", "voltage_measured", "pattern", "signature"))
+                writer.writerows(
+                    (*position_xyz(fault), fault.get("time"), fault.get("voltage_set"), fault.get("voltage_measured"), fault.get("pattern"), fault.get("signature"))
+                    for fault in CONFIRMED_FAULTS)
 
             logger.info(f"Exported {len(CONFIRMED_FAULTS)} faults to {csv_results_filename}")
 
             # 2. Create XY fault map
             results_mapname = BASENAME_FILES + "_faultmap" + ".png"
-            if os.path.exists(results_mapname):
-
-                i = 2
-                while os.path.exists(results_mapname[:-4] + "_" + str(i) + ".png"):
-                    i += 1
-
-                results_mapname = results_mapname[:-4] + "_" + str(i) + ".png"
+            results_mapname = next_free_filename(results_mapname)
 
-            # Extract x and y coordinates from CONFIRMED_FAULTS
-            x_faults = [fault["position"]["X"] for fault in CONFIRMED_FAULTS]
-            y_faults = [fault["position"]["Y"] for fault in CONFIRMED_FAULTS]
-            
-            # Create a grid for the heatmap
-            x_bins = np.linspace(BOUNDARIES["X"]["RIGHT"], BOUNDARIES["X"]["LEFT"], resolution)
-            y_bins = np.linspace(BOUNDARIES["Y"]["DOWN"], BOUNDARIES["Y"]["UP"], resolution)
-            
-            # Create 2D histogram
-            hist, _, _ = np.histogram2d(x_faults, y_faults, bins=[x_bins, y_bins])
-            
-            # Create the plot
-            plt.figure(figsize=(10, 8))
-            
-            # Plot heatmap
-            plt.imshow(hist.T,  # Transpose to match coordinate system
-                    extent=[BOUNDARIES["X"]["RIGHT"], BOUNDARIES["X"]["LEFT"],
-                            BOUNDARIES["Y"]["DOWN"], BOUNDARIES["Y"]["UP"]],
-                    origin='lower',  # Place (0,0) at bottom left
-                    aspect='auto',
-                    cmap='hot',
-                    interpolation='gaussian')
-            
-            # Invert x-axis because that is how our motors are set up
-            plt.gca().invert_xaxis()
-            
-            # Add colorbar
-            plt.colorbar(label='Number of Faults')
-            
-            # Add labels and title
-            plt.xlabel('X Position (mm)')
-            plt.ylabel('Y Position (mm)')
-            plt.title('Fault Distribution Heatmap')
-            
-            # Show grid
-            plt.grid(True, alpha=0.3)
-            plt.scatter(x_faults, y_faults, color='blue', alpha=0.5, s=20)
-
-            plt.savefig(results_mapname)
+            save_heatmap(CONFIRMED_FAULTS, x_bins, y_bins, 'Number of Faults', 'Fault Distribution Heatmap', results_mapname)
 
             logger.info(f"Saved fault map to {results_mapname}")
         except Exception as e:
             logger.error(f"Failed to export results at the end: {e}")
-            return
 
     if len(CONFIRMED_ALARMS) == 0:
         logger.info("No alarms found. Skipping export of alarms and alarm map.")
@@ -3153,79 +3626,27 @@ def export_faults_and_map(resolution=50):
         try:
             csv_alarm_filename = BASENAME_FILES + "_alarms.csv"
 
-            if os.path.exists(csv_alarm_filename):
-
-                i = 2
-                while os.path.exists(csv_alarm_filename[:-4] + "_" + str(i) + ".csv"):
-                    i += 1
-
-                csv_alarm_filename = csv_alarm_filename + "_" + str(i) + ".csv"
+            csv_alarm_filename = next_free_filename(csv_alarm_filename)
 
             with open(csv_alarm_filename, "w", newline="") as csvfile:
                 alarm_fields = [alarm for alarm in ALARMS_DEFINED if "TEST_ALARM" not in alarm]
-                fieldnames = ["x", "y", "z", "time", "voltage_set", "voltage_measured", "pattern"] + alarm_fields
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                for alarm in CONFIRMED_ALARMS:
-                    pos = alarm.get("position", {})
-                    row = {
-                        "x": pos.get("X"),
-                        "y": pos.get("Y"),
-                        "z": pos.get("Z"),
-                        "time": alarm.get("time"),
-                        "voltage_set": alarm.get("voltage_set"),
-                        "voltage_measured": alarm.get("voltage_measured"),
-                        "pattern": alarm.get("pattern"),
-                    }
-                    alarms_list = alarm.get("alarms", [])
-                    for alarm_name in alarm_fields:
-                        row[alarm_name] = "x" if alarm_name in alarms_list else ""
-                    writer.writerow(row)
+                writer = csv.writer(csvfile)
+                writer.writerow(("x", "y", "z", "time", "voltage_set", "voltage_measured", "pattern", *alarm_fields))
+                writer.writerows(
+                    (*position_xyz(alarm), alarm.get("time"), alarm.get("voltage_set"), alarm.get("voltage_measured"), alarm.get("pattern"),
+                     *("x" if alarm_name in alarm.get("alarms", []) else "" for alarm_name in alarm_fields))
+                    for alarm in CONFIRMED_ALARMS)
 
             logger.info(f"Exported {len(CONFIRMED_ALARMS)} alarms to {csv_alarm_filename}")
 
             alarm_mapname = BASENAME_FILES + "_alarmmap" + ".png"
-            if os.path.exists(alarm_mapname):
+            alarm_mapname = next_free_filename(alarm_mapname)
 
-                i = 2
-                while os.path.exists(alarm_mapname[:-4] + "_" + str(i) + ".png"):
-                    i += 1
-
-                alarm_mapname = alarm_mapname[:-4] + "_" + str(i) + ".png"
-
-            x_alarms = [alarm["position"]["X"] for alarm in CONFIRMED_FAULTS]
-            y_alarms = [alarm["position"]["Y"] for alarm in CONFIRMED_FAULTS]
-            
-            x_bins = np.linspace(BOUNDARIES["X"]["RIGHT"], BOUNDARIES["X"]["LEFT"], resolution)
-            y_bins = np.linspace(BOUNDARIES["Y"]["DOWN"], BOUNDARIES["Y"]["UP"], resolution)
-            
-            hist, _, _ = np.histogram2d(x_alarms, y_alarms, bins=[x_bins, y_bins])
-            
-            plt.figure(figsize=(10, 8))
-            plt.imshow(hist.T,  # Transpose to match coordinate system
-                    extent=[BOUNDARIES["X"]["RIGHT"], BOUNDARIES["X"]["LEFT"],
-                            BOUNDARIES["Y"]["DOWN"], BOUNDARIES["Y"]["UP"]],
-                    origin='lower',  # Place (0,0) at bottom left
-                    aspect='auto',
-                    cmap='hot',
-                    interpolation='gaussian')
-            
-            plt.gca().invert_xaxis()
-            plt.colorbar(label='Number of Alerts')
-            
-            plt.xlabel('X Position (mm)')
-            plt.ylabel('Y Position (mm)')
-            plt.title('Alarm Distribution Heatmap')
-            
-            plt.grid(True, alpha=0.3)
-            plt.scatter(x_alarms, y_alarms, color='blue', alpha=0.5, s=20)
-
-            plt.savefig(alarm_mapname)
+            save_heatmap(CONFIRMED_ALARMS, x_bins, y_bins, 'Number of Alerts', 'Alarm Distribution Heatmap', alarm_mapname)
 
             logger.info(f"Saved alarm map to {alarm_mapname}")
         except Exception as e:
             logger.error(f"Failed to export alarms at the end: {e}")
-            return
 
     # Move files to a separate directory
     new_dir = ""
@@ -3246,52 +3667,38 @@ def export_faults_and_map(resolution=50):
         if not os.path.exists(new_dir):
             os.makedirs(new_dir)
 
-        # Move checkpoint (and append ".finished" to the filename)
-        if CHECKPOINT_FILE and os.path.exists(CHECKPOINT_FILE):
-            os.rename(CHECKPOINT_FILE, os.path.join(new_dir, CHECKPOINT_FILE + ".finished"))
-            logger.info(f"Moved checkpoint file to {os.path.join(new_dir, CHECKPOINT_FILE + ".finished")}")
-        else:
-            logger.info(f"No checkpoint file to move. Looked for {CHECKPOINT_FILE if CHECKPOINT_FILE else ''}")
-
-        # Move unparseable signatures file
-        if os.path.exists(BASENAME_FILES + "_unparseable.raw"):
-            os.rename(BASENAME_FILES + "_unparseable.raw", os.path.join(new_dir, BASENAME_FILES + "_unparseable.raw"))
-            logger.info(f"Moved unparseable signatures file to {os.path.join(new_dir, BASENAME_FILES + "_unparseable.raw")}")
-        elif TARGET.number_of_unparseables > 0:
-            logger.error(f"Found no unparseable signatures file to move even though {TARGET.number_of_unparseables} of such signatures were incountered in this run. Looked for {BASENAME_FILES + '_unparseable.raw'}")
-        else:
-            logger.info(f"No unparseable signatures were found during this run")
-            
-
-        # Move results CSV
-        if csv_results_filename and os.path.exists(csv_results_filename):
-            os.rename(csv_results_filename, os.path.join(new_dir, csv_results_filename))
-            logger.info(f"Moved results CSV to {os.path.join(new_dir, csv_results_filename)}")
-        elif len(CONFIRMED_FAULTS) > 0:
-            logger.error(f"{('Looked for ' + csv_results_filename + ' but found') if csv_results_filename else 'Found'} no results CSV to move although there should have been faulty signatures exported!") 
-            
-
-        # Move faultmap
-        if results_mapname and os.path.exists(results_mapname):
-            os.rename(results_mapname, os.path.join(new_dir, results_mapname))
-            logger.info(f"Moved faultmap to {os.path.join(new_dir, results_mapname)}")
-        elif len(CONFIRMED_FAULTS) > 0:
-            logger.error(f"{('Looked for ' + results_mapname + ' but found') if results_mapname else 'Found'} no results map to move although there should have been faulty signatures exported!") 
-
-        # Move alarm CSV
-        if csv_alarm_filename and os.path.exists(csv_alarm_filename):
-            os.rename(csv_alarm_filename, os.path.join(new_dir, csv_alarm_filename))
-            logger.info(f"Moved alarm CSV to {os.path.join(new_dir, csv_alarm_filename)}")
-        elif len(CONFIRMED_ALARMS) > 0:
-            logger.error(f"{('Looked for ' + csv_alarm_filename + ' but found') if csv_alarm_filename else 'Found'} no alarm CSV to move although there should have been faulty signatures exported!") 
-            
+        # Buffered unparseable signatures have to be on disk before the file is moved
+        with target_lock:
+            TARGET._close_unparseable_file()
+
+        # Source, name in new_dir, description and whether this run must have produced the file
+        move_plan = [
+            (CHECKPOINT_FILE, f"{CHECKPOINT_FILE}.finished", "checkpoint file", False),
+            (BASENAME_FILES + "_unparseable.raw", BASENAME_FILES + "_unparseable.raw", "unparseable signatures file", TARGET.number_of_unparseables > 0),
+            (csv_results_filename, csv_results_filename, "results CSV", len(CONFIRMED_FAULTS) > 0),
+            (results_mapname, results_mapname, "faultmap", len(CONFIRMED_FAULTS) > 0),
+            (csv_alarm_filename, csv_alarm_filename, "alarm CSV", len(CONFIRMED_ALARMS) > 0),
+            (alarm_mapname, alarm_mapname, "alarmmap", len(CONFIRMED_ALARMS) > 0),
+        ]
+        moves = []
+        for src, dst_name, description, required in move_plan:
+            if src and os.path.exists(src):
+                moves.append((src, os.path.join(new_dir, dst_name), description))
+            elif required:
+                logger.error(f"Found no {description} to move{f' (looked for {src})' if src else ''} although this run should have produced one!")
+            else:
+                logger.info(f"No {description} to move")
 
-        # Move alarmmap
-        if alarm_mapname and os.path.exists(alarm_mapname):
-            os.rename(alarm_mapname, os.path.join(new_dir, alarm_mapname))
-            logger.info(f"Moved alarmmap to {os.path.join(new_dir, alarm_mapname)}")
-        elif len(CONFIRMED_ALARMS) > 0:
-            logger.error(f"{('Looked for ' + alarm_mapname + ' but found') if alarm_mapname else 'Found'} no alarm map to move although there should have been alarms exported!") 
+        # shutil.move copies if new_dir is on another file system, so the large files are moved side by side.
+        # One failed move does not keep the others from happening
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {pool.submit(shutil.move, src, dst): (dst, description) for src, dst, description in moves}
+        for future, (dst, description) in futures.items():
+            try:
+                future.result()
+                logger.info(f"Moved {description} to {dst}")
+            except Exception as e:
+                logger.error(f"Failed to move {description} to {dst}: {e}")
 
         # Move log file
         update_logfile(os.path.join(new_dir, BASENAME_FILES))
@@ -3560,7 +3967,7 @@ class LoadCheckpointDisplay(ModalScreen):
     def select_and_load_checkpoint(self):
 
         def callback(sel: int | None) -> None:
-            global BOUNDARIES, CURRENT_POSITION, REFERENCE_POINT, TRIES_LEFT_PER_POSITION, CONFIRMED_FAULTS, CONFIRMED_ALARMS, PAST_TIMINGS, CHECKPOINT_FILE, TARGET_NAME, CURRENT_PROGRESS, TOTAL_PROGRESS, SIGNATURES_PARAMS, STARTING_POSITION
+            global BOUNDARIES, CURRENT_POSITION, CURRENT_POSITION_TUPLE, REFERENCE_POINT, TRIES_LEFT_PER_POSITION, CONFIRMED_FAULTS, CONFIRMED_ALARMS, PAST_TIMINGS, CHECKPOINT_FILE, TARGET_NAME, CURRENT_PROGRESS, TOTAL_PROGRESS, PROGRESS_NBYTES, SIGNATURES_PARAMS, STARTING_POSITION
 
             fname = self.checkpoints[int(sel)][0]
             with open(fname, "rb") as f:
@@ -3569,14 +3976,16 @@ class LoadCheckpointDisplay(ModalScreen):
             # Restore variables
             BOUNDARIES = checkpoint["BOUNDARIES"]
             CURRENT_POSITION = checkpoint["CURRENT_POSITION"]
+            CURRENT_POSITION_TUPLE = Position(**CURRENT_POSITION)
             REFERENCE_POINT = checkpoint["REFERENCE_POINT"]
             STARTING_POSITION = checkpoint["CURRENT_POSITION"]
             TRIES_LEFT_PER_POSITION = checkpoint["TRIES_LEFT_PER_POSITION"]
             CONFIRMED_FAULTS = checkpoint["CONFIRMED_FAULTS"]
             CONFIRMED_ALARMS = checkpoint["CONFIRMED_ALARMS"]
-            PAST_TIMINGS = checkpoint["PAST_TIMINGS"]
+            PAST_TIMINGS = PastTimings.from_checkpoint(checkpoint["PAST_TIMINGS"])
             CURRENT_PROGRESS = checkpoint["CURRENT_PROGRESS"]
             TOTAL_PROGRESS = checkpoint["TOTAL_PROGRESS"]
+            PROGRESS_NBYTES = progress_nbytes(TOTAL_PROGRESS)
             TARGET_NAME = checkpoint["TARGET_NAME"]
             CHECKPOINT_FILE = fname
             update_logfile("_".join(str(fname[:-4]).split("_")[:-1]))
@@ -3696,7 +4105,7 @@ class LabInitialization(App):
 
         logger.debug("The following devices are connected:")
         for port in serial.tools.list_ports.comports():
-            logger.debug(f"- Port: {port.device}, Description: {port.description}, Serial Number: {port.serial_number}")
+            logger.debug("- Port: %s, Description: %s, Serial Number: %s", port.device, port.description, port.serial_number)
 
         if args.dryrun:
             logger.warning("Dryrun: Set fake COM Ports")
@@ -3823,7 +4232,7 @@ class StatusDisplay(Static):
         self.update(
             f"{'STOPPED' if stop_event.is_set() else 'RUNNING'} | CS: {'ON' if CS.enabled else 'OFF'} | Target state: {TARGET.target_state.name}\n"
             f"Voltage: {FAULT_VOLTAGE:.2f} V | Deadtime: {DEAD_TIME} ms | Variable: Delay ({'ON' if VARIABLE_DELAY else 'OFF'}) Voltage ({'ON' if VARIABLE_VOLTAGE else 'OFF'}) High Time ({'ON' if VARIABLE_HIGH_TIME else 'OFF'})\n"
-            f"Total Signatures: {SIG_COUNTER} | Parseable: {TARGET.number_of_signatures} | Unparseable: {TARGET.number_of_unparseables} | With faults: {len(CONFIRMED_FAULTS)} | With alarms: {len(CONFIRMED_ALARMS)} | Tries left on Position: {TRIES_LEFT_PER_POSITION} / {TRIES_PER_POSITION} | Moved {POS_COUNTER} / {STEPS_REQUIRED}\n" 
+            f"Total Signatures: {COUNTERS.total} | Parseable: {TARGET.number_of_signatures} | Unparseable: {TARGET.number_of_unparseables} | With faults: {len(CONFIRMED_FAULTS)} | With alarms: {len(CONFIRMED_ALARMS)} | Tries left on Position: {TRIES_LEFT_PER_POSITION} / {TRIES_PER_POSITION} | Moved {SCAN.pos_counter} / {STEPS_REQUIRED}\n" 
         )
 class LabControl(App):
     BINDINGS = [
@@ -3887,11 +4296,13 @@ class LabControl(App):
          
     def on_mount(self) -> None:
         global CHIPSHOUTER_PORT, TARGET_PORT
-        global DELAY_INCREMENT_in_ms, NO_OF_TRIES_PER_DELAY_INCREMENT, TRIES_PER_POSITION, TRIES_LEFT_PER_POSITION, TRIES_LEFT_PER_POSITION_AND_TIME, VARIABLE_DELAY, TOTAL_PROGRESS, STEPS_REQUIRED
+        global DELAY_INCREMENT_in_ms, NO_OF_TRIES_PER_DELAY_INCREMENT, TRIES_PER_POSITION, TRIES_LEFT_PER_POSITION, TRIES_LEFT_PER_POSITION_AND_TIME, VARIABLE_DELAY, TOTAL_PROGRESS, PROGRESS_NBYTES, STEPS_REQUIRED
         global AXES, CS, TARGET
 
         # Setup logging to Textual
         self.log_widget = self.query_one("#system_log")
+        self.progress_bar = self.query_one("#progress")
+        self.status_display = self.query_one("#status")
 
         for line in self.old_logs:
             self.log_widget.write(line + "\n")
@@ -3926,8 +4337,11 @@ class LabControl(App):
 
         STEPS_REQUIRED = int(( (BOUNDARIES["X"]["LEFT"] - BOUNDARIES["X"]["RIGHT"] + 1) // STEP_SIZE ) * ( (BOUNDARIES["Y"]["UP"] - BOUNDARIES["Y"]["DOWN"] + 1) // STEP_SIZE ))
         TOTAL_PROGRESS = STEPS_REQUIRED * TRIES_PER_POSITION
+        PROGRESS_NBYTES = progress_nbytes(TOTAL_PROGRESS)
         logger.info(f"Starting with {CURRENT_PROGRESS} of {TOTAL_PROGRESS} tries.")
         store_positions(AXES)
+        with SCAN.lock:
+            SCAN.path = _build_scan_path(CURRENT_POSITION["X"], CURRENT_POSITION["Y"], SCAN.direction)
 
         TARGET = SerialTarget(TARGET_PORT, TARGET_BAUDRATE, "TARGET", event_queue, stop_event)
 
@@ -3938,6 +4352,9 @@ class LabControl(App):
         )
         self.target_thread.start()
 
+        logger.info("Starting export thread")
+        threading.Thread(target=export_loop, daemon=True).start()
+
         logger.info("Starting worker thread")
         self.worker_thread = threading.Thread(
             target=self.worker_loop
@@ -3958,22 +4375,20 @@ class LabControl(App):
             TARGET.reset()
         except Exception as e:
             logger.info("Setup finished but failed to reset target. Plug in target now, if not done already, and then arm the ChipShouter manually")
-            logger.debug(f"Error resetting target: {e}")
+            logger.debug("Error resetting target: %s", e)
         else:
             logger.info("Setup finished.")
         
     def update_ui(self):
-        progress_bar = self.query_one("#progress")
-        status_display = self.query_one("#status")
         try:
-            progress_bar.update(total=TOTAL_PROGRESS,progress=CURRENT_PROGRESS)
-            status_display.update_status()
+            self.progress_bar.update(total=TOTAL_PROGRESS,progress=CURRENT_PROGRESS)
+            self.status_display.update_status()
 
         except Exception as e:
-            tb = traceback.extract_tb(e.__traceback__)
-            if tb:
-                filename, lineno, func, text = tb[-1]
-                logger.error(f"Failed to update UI: {filename} raised an error on line {lineno} (func {func}): {text}\n{e}")
+            frame = _last_frame(e)
+            if frame:
+                filename, lineno, func = frame
+                logger.error(f"Failed to update UI: {filename} raised an error on line {lineno} (func {func})\n{e}")
             else:
                 logger.error(f"Failed to update UI:\n{e}")  
 
@@ -3993,10 +4408,10 @@ class LabControl(App):
                 CS.selfheal()
 
             except Exception as e:
-                tb = traceback.extract_tb(e.__traceback__)
-                if tb:
-                    filename, lineno, func, text = tb[-1]
-                    logger.error(f"Handling worker_loop exception failed with {type(e)}: {filename} raised an error on line {lineno} (func {func}): {text} ('{e}'). Exiting application.")
+                frame = _last_frame(e)
+                if frame:
+                    filename, lineno, func = frame
+                    logger.error(f"Handling worker_loop exception failed with {type(e)}: {filename} raised an error on line {lineno} (func {func}) ('{e}'). Exiting application.")
                 else:
                     logger.error(f"Handling worker_loop exception failed with {type(e)} ({e}). Exiting application.")
                 export_params()
@@ -4045,15 +4460,20 @@ class LabControl(App):
                         logger.error(f"Worker loop caught an {type(e)} ({e}) by the handler for keyword '{keyword}'. Initializing selfheal.")
                         handleException()
 
+                    finally:
+                        # Handlers copy what they keep, so the parameters can be reused
+                        if sig_params is not None:
+                            sig_params.release()
+
                 else:
                     logger.warning(f"{device} sent unexpected keyword: {keyword}.")      
             
         except Exception as e:
             save_checkpoint()
-            tb = traceback.extract_tb(e.__traceback__)
-            if tb:
-                filename, lineno, func, text = tb[-1]
-                logger.error(f"Error in worker_loop: {filename} raised an error on line {lineno} (func {func}): {text}\n{e}")
+            frame = _last_frame(e)
+            if frame:
+                filename, lineno, func = frame
+                logger.error(f"Error in worker_loop: {filename} raised an error on line {lineno} (func {func})\n{e}")
             else:
                 logger.error(f"Error in worker_loop:\n{e}")  
         
@@ -4203,9 +4623,10 @@ class LabControl(App):
 
     def action_set_tries_per_position(self) -> None:
         def callback(new_tries: int | None) -> None:
-            global TRIES_PER_POSITION, TRIES_LEFT_PER_POSITION, TOTAL_PROGRESS
+            global TRIES_PER_POSITION, TRIES_LEFT_PER_POSITION, TOTAL_PROGRESS, PROGRESS_NBYTES
             if new_tries is not None and new_tries != TRIES_PER_POSITION:
-                TOTAL_PROGRESS = TOTAL_PROGRESS - (STEPS_REQUIRED - POS_COUNTER) * TRIES_PER_POSITION + (STEPS_REQUIRED - POS_COUNTER) * new_tries
+                TOTAL_PROGRESS = TOTAL_PROGRESS - (STEPS_REQUIRED - SCAN.pos_counter) * TRIES_PER_POSITION + (STEPS_REQUIRED - SCAN.pos_counter) * new_tries
+                PROGRESS_NBYTES = progress_nbytes(TOTAL_PROGRESS)
                 TRIES_PER_POSITION = new_tries
                 if TRIES_LEFT_PER_POSITION > TRIES_PER_POSITION:
                     TRIES_LEFT_PER_POSITION = TRIES_PER_POSITION
@@ -4241,7 +4662,7 @@ class LabControl(App):
 
         def cleanup():
             logger.info("Shutting down...")
-            logger.info(f"Moved {POS_COUNTER} times and received {SIG_COUNTER} signatures. {TRIES_PER_POSITION} tries per position were configured.")
+            logger.info(f"Moved {SCAN.pos_counter} times and received {COUNTERS.total} signatures. {TRIES_PER_POSITION} tries per position were configured.")
             stop_event.set()
 
             time.sleep(0.5)
@@ -4271,20 +4692,14 @@ class LabControl(App):
                     logger.info("Disconnected ChipSHOUTER")
                 
 
-            if PAST_TIMINGS["between_trigger_and_signGen_ms"] and PAST_TIMINGS["trigger_duration_ns"]:
-                logger.info(f"Recorded {len(PAST_TIMINGS['between_trigger_and_signGen_ms'])} shots")
+            if len(PAST_TIMINGS):
+                logger.info(f"Recorded {PAST_TIMINGS.count} shots (statistics over the last {len(PAST_TIMINGS)})")
 
-                values = PAST_TIMINGS["between_trigger_and_signGen_ms"]
-                mean_time = sum(values) / len(values)
-                variance = sum((x - mean_time) ** 2 for x in values) / len(values)
-                stddev = math.sqrt(variance)
-                logger.info(f"Mean duration: {mean_time:.3f} ms, StdDev: {stddev:.3f} ms")
+                values = PAST_TIMINGS.window("between_trigger_and_signGen_ms")
+                logger.info(f"Mean duration: {values.mean():.3f} ms, StdDev: {values.std():.3f} ms")
 
-                values = PAST_TIMINGS["trigger_duration_ns"]
-                mean_time = sum(values) / len(values)
-                variance = sum((x - mean_time) ** 2 for x in values) / len(values)
-                stddev = math.sqrt(variance)
-                logger.info(f"Mean trigger duration: {mean_time:.3f} ns, StdDev: {stddev:.3f} ns")
+                values = PAST_TIMINGS.window("trigger_duration_ns")
+                logger.info(f"Mean trigger duration: {values.mean():.3f} ns, StdDev: {values.std():.3f} ns")
 
             else:
                 logger.info("No timings recorded yet.")
@@ -4323,7 +4738,9 @@ def main():
     if log_buffer:
         app = LabControl(log_buffer)
         app.run()
-        print(f"Saved Logfile to {LOGFILE}")        
+        print(f"Saved Logfile to {LOGFILE}")
+
+    log_listener.stop()
 
 if __name__ == "__main__":
     main()